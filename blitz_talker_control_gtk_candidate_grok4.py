@@ -2,21 +2,31 @@
 import subprocess
 import os
 import re
-import shlex
 import time
 import threading
 import sys
 import gi
 import urllib.parse
 import shutil
-import argparse
+import functools
+import itertools
+from collections import OrderedDict
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 gi.require_version('Gtk', '3.0')
 gi.require_version('Gdk', '3.0')
 gi.require_version('GdkPixbuf', '2.0')
 gi.require_version('Pango', '1.0')
-from gi.repository import Gtk, Gdk, GLib, Pango, GdkPixbuf
+from gi.repository import Gtk, Gdk, GLib, Pango, GdkPixbuf, Gio, GObject
+
+try:
+    from Xlib import X, display as xlib_display
+    from Xlib.protocol import event as xlib_event
+except ImportError:
+    X = None
+    xlib_display = None
+    xlib_event = None
 
 USER_ENV = '.user_env'
 IMAGINE_ENV = '.imagine_env'
@@ -26,6 +36,26 @@ DEBUG_DIR = os.path.join(SCRIPT_DIR, '.debug')
 os.makedirs(DEBUG_DIR, exist_ok=True)
 
 RUNTIME_KEYS = {'FIRE_MODE'}
+ENV_ROWS_FIRST = 30
+ENV_ROWS_PER_IDLE = 15
+ENV_COL_WIDTH = 220
+THUMB_CACHE_SIZE = 64
+
+EDITOR_GEOM_KEYS = (
+    ('env_saved_width', 'ENV_EDITOR_WIDTH', 0),
+    ('env_saved_height', 'ENV_EDITOR_HEIGHT', 0),
+    ('env_saved_x_off', 'ENV_EDITOR_X_OFFSET', 0),
+    ('env_saved_y_off', 'ENV_EDITOR_Y_OFFSET', 0),
+    ('gxi_saved_width', 'GXI_EDITOR_WIDTH', 0),
+    ('gxi_saved_height', 'GXI_EDITOR_HEIGHT', 0),
+    ('gxi_saved_x_off', 'GXI_EDITOR_X_OFFSET', 0),
+    ('gxi_saved_y_off', 'GXI_EDITOR_Y_OFFSET', 0),
+    ('gallery_saved_width', 'GALLERY_EDITOR_WIDTH', 1200),
+    ('gallery_saved_height', 'GALLERY_EDITOR_HEIGHT', 800),
+    ('gallery_saved_x_off', 'GALLERY_EDITOR_X_OFFSET', 100),
+    ('gallery_saved_y_off', 'GALLERY_EDITOR_Y_OFFSET', 100),
+    ('gxi_paned_position', 'GXI_PANED_POSITION', 500),
+)
 
 CAT_FILE = 1 << 0
 CAT_WINDOW = 1 << 1
@@ -38,10 +68,21 @@ CAT_XDO = 1 << 7
 
 GLOBAL_DEBUG_MASK = 0xFF
 
+_KV_START_RE = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*)=')
+_WS_NL_RE = re.compile(r'\s*\n\s*')
+# Commas become spaces so a plain str.split() handles every separator run
+_URL_SPLIT_TABLE = str.maketrans(',', ' ')
+_DIGITS_RE = re.compile(r'\d+')
+
 def log_debug(category, content):
     if GLOBAL_DEBUG_MASK & category:
+        if callable(content):
+            content = content()
         print(f"[DEBUG {category_name(category)}] {content}")
 
+def log_enabled(category):
+    return bool(GLOBAL_DEBUG_MASK & category)
+
 def category_name(bit):
     names = {CAT_FILE: "FILE", CAT_WINDOW: "WINDOW", CAT_INPUT: "INPUT",
              CAT_DAEMON: "DAEMON", CAT_GUI: "GUI", CAT_INIT: "INIT",
@@ -51,191 +92,471 @@ def category_name(bit):
 log_debug(CAT_INIT, "=== SCRIPT START - FULL BLAST DEBUG ENABLED ===")
 
 def safe_int(val, default=0):
+    if type(val) is int:
+        return val
+    if val is None:
+        return default
+    if isinstance(val, str):
+        s = val.strip()
+        if not s:
+            return default
+        if s.isdecimal() or (s[:1] == '-' and s[1:].isdecimal()):
+            return int(s)
     try: return int(float(val))
     except: return default
 
+TRUE_VALUES = frozenset(('1', 'y', 'true', 'yes', 'on'))
+_TRUE_EXACT = TRUE_VALUES | frozenset(('Y', 'True', 'TRUE', 'Yes', 'YES', 'On', 'ON'))
+
+def is_truthy(val):
+    # Common spellings hit the exact set; only odd casing pays for lower()
+    if val in _TRUE_EXACT:
+        return True
+    return isinstance(val, str) and val.lower() in TRUE_VALUES
+
+def set_buffer_text(buffer, text):
+    # Clearing an already empty buffer would still emit changed and relayout the view
+    if not text and buffer.get_char_count() == 0:
+        return
+    buffer.set_text(text)
+
 def safe_float(val, default=0.0):
     try: return float(val)
     except: return default
 
 def percent_to_pixels(percent_str, dimension):
-    if '%' in str(percent_str):
-        return int(dimension * int(str(percent_str).rstrip('%')) / 100)
-    return int(percent_str)
+    s = percent_str if isinstance(percent_str, str) else str(percent_str)
+    if '%' not in s:
+        return int(percent_str)
+    return int(dimension * int(s.rstrip('%')) / 100)
+
+def read_small_file(full_path):
+    # open, fstat, one read sized to the file, close; no text-layer buffering round-trips for config-sized files
+    fd = os.open(full_path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        want = os.fstat(fd).st_size + 1
+        chunks = []
+        while True:
+            chunk = os.read(fd, want)
+            chunks.append(chunk)
+            if len(chunk) < want:
+                break
+            want = 65536
+    finally:
+        os.close(fd)
+    return b''.join(chunks)
+
+def write_file_atomic(full_path, data):
+    # Whole-file replace through a sibling temp file; readers see the old or the new contents, never a partial write
+    try:
+        mode = os.stat(full_path).st_mode & 0o777
+    except OSError:
+        mode = 0o644
+    tmp_path = f"{full_path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, mode)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        # The rename must not reach disk ahead of the data, or a crash leaves an empty file in place
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, full_path)
+
+def _text_lines(data, keepends=False, errors='strict'):
+    # Lines of decoded file bytes with universal newlines, as text-mode iteration would yield them
+    text = data.decode('utf-8', errors)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    lines = text.split('\n')
+    last = lines.pop()
+    if keepends:
+        lines = [line + '\n' for line in lines]
+    if last:
+        lines.append(last)
+    return lines
 
 def load_env_multiline(path):
     env = {}
     full_path = os.path.join(SCRIPT_DIR, path)
     log_debug(CAT_FILE, f"load_env_multiline: OPENING {full_path}")
-    if not os.path.exists(full_path):
-        log_debug(CAT_FILE, f"load_env_multiline: FILE NOT FOUND {full_path}")
-        return env
     try:
-        with open(full_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        log_debug(CAT_FILE, f"load_env_multiline: SUCCESS - {len(lines)} lines from {full_path}")
-        i = 0
-        while i < len(lines):
-            line = lines[i].rstrip('\n')
+        f = iter(_text_lines(read_small_file(full_path)))
+        raw = next(f, None)
+        while raw is not None:
+            line = raw
+            raw = next(f, None)
             stripped = line.strip()
             if not stripped or stripped.startswith('#'):
-                i += 1
                 continue
-            m = re.match(r'^([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*)$', line)
-            if not m:
-                i += 1
+            # KEY = value with an ASCII identifier key; plain string ops instead of the regex engine
+            eq = line.find('=')
+            if eq <= 0:
+                continue
+            key = line[:eq].rstrip()
+            if not (key.isascii() and key.isidentifier()):
                 continue
-            key = m.group(1)
-            value_part = m.group(2)
+            value_part = line[eq + 1:].lstrip()
 
             stripped_value = value_part.strip()
             if stripped_value and stripped_value[0] in ('#', '~') and len(stripped_value.split()[0]) == 1:
                 value = stripped_value[0]
-                log_debug(CAT_FILE, f"load_env_multiline: LITERAL SPECIAL CHAR DETECTED {key} = '{value}' from {full_path}")
+                log_debug(CAT_FILE, lambda: f"load_env_multiline: LITERAL SPECIAL CHAR DETECTED {key} = '{value}' from {full_path}")
             else:
                 value = value_part.split('#', 1)[0]
 
-            while i + 1 < len(lines):
-                next_line = lines[i + 1].rstrip('\n')
+            while raw is not None:
+                next_line = raw
                 next_stripped = next_line.strip()
-                if next_stripped.startswith('#') or re.match(r'^([A-Za-z_][A-Za-z0-9_]*)=', next_line):
+                if next_stripped.startswith('#') or ('=' in next_line and _KV_START_RE.match(next_line)):
                     break
                 value += '\n' + next_line
-                i += 1
+                raw = next(f, None)
                 if not next_line.rstrip().endswith('\\'):
                     break
 
             value = value.replace('\\\n', '')
-            value = re.sub(r'\s*\n\s*', ' ', value)
+            value = _WS_NL_RE.sub(' ', value)
             value = value.strip()
             if (value.startswith('"') and value.endswith('"')) or (value.startswith("'") and value.endswith("'")):
                 value = value[1:-1].strip()
 
             env[key] = value
-            log_debug(CAT_FILE, f"load_env_multiline: PARSED {key} = '{value}' from {full_path}")
-            i += 1
+            log_debug(CAT_FILE, lambda: f"load_env_multiline: PARSED {key} = '{value}' from {full_path}")
+        log_debug(CAT_FILE, f"load_env_multiline: SUCCESS - {len(env)} keys from {full_path}")
+    except FileNotFoundError:
+        log_debug(CAT_FILE, f"load_env_multiline: FILE NOT FOUND {full_path}")
     except Exception as e:
         log_debug(CAT_FILE, f"load_env_multiline: ERROR reading {full_path}: {e}")
     return env
 
+_ENV_PARSED = {}
+
+def load_env_cached(path):
+    # Shared parsed dict keyed on mtime and size so edits invalidate; callers must not mutate it
+    try:
+        st = os.stat(os.path.join(SCRIPT_DIR, path))
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    cached = _ENV_PARSED.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    env = load_env_multiline(path)
+    _ENV_PARSED[path] = (stamp, env)
+    return env
+
 def get_merged_multiline(key):
     if key in user_cache:
-        log_debug(CAT_FILE, f"get_merged_multiline: {key} = '{user_cache[key]}' ← user_cache WINNER")
+        log_debug(CAT_FILE, lambda: f"get_merged_multiline: {key} = '{user_cache[key]}' ← user_cache WINNER")
         return user_cache[key]
     for file in (IMAGINE_ENV, SYSTEM_ENV):
-        env = load_env_multiline(file)
+        env = load_env_cached(file)
         if key in env:
-            log_debug(CAT_FILE, f"get_merged_multiline: {key} = '{env[key]}' ← from {file}")
+            log_debug(CAT_FILE, lambda: f"get_merged_multiline: {key} = '{env[key]}' ← from {file}")
             return env[key]
-    log_debug(CAT_FILE, f"get_merged_multiline: {key} NOT FOUND")
+    log_debug(CAT_FILE, lambda: f"get_merged_multiline: {key} NOT FOUND")
     return ''
 
-def read_key(file, key):
-    full_path = os.path.join(SCRIPT_DIR, file)
-    log_debug(CAT_FILE, f"read_key: checking {full_path} for {key}")
-    if not os.path.exists(full_path):
-        log_debug(CAT_FILE, f"read_key: file missing {full_path}")
-        return None
-    try:
-        with open(full_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip().startswith(f'{key}='):
-                    v = line.split('=', 1)[1]
-                    v = v.split('#', 1)[0].strip().strip('"\'')
-                    log_debug(CAT_FILE, f"read_key: FOUND {key} = '{v}' in {file}")
-                    return v
-    except Exception as e:
-        log_debug(CAT_FILE, f"read_key: ERROR on {file}: {e}")
-    log_debug(CAT_FILE, f"read_key: {key} NOT FOUND in {file}")
-    return None
+_merged_state = (None, None, {}, {})
+
+def merged_env():
+    # (value, source file) maps over system < imagine < user_cache, rebuilt only when a cached parse is replaced
+    global _merged_state
+    imagine = load_env_cached(IMAGINE_ENV)
+    system = load_env_cached(SYSTEM_ENV)
+    if _merged_state[0] is not imagine or _merged_state[1] is not system:
+        merged = {}
+        source = {}
+        for file, env in ((SYSTEM_ENV, system), (IMAGINE_ENV, imagine), (USER_ENV, user_cache)):
+            merged.update(env)
+            source.update(dict.fromkeys(env, file))
+        _merged_state = (imagine, system, merged, source)
+    return _merged_state[2], _merged_state[3]
 
 def read_merged_key(key):
-    if key in user_cache:
-        log_debug(CAT_FILE, f"read_merged_key: {key} = '{user_cache[key]}' ← user_cache WINNER")
-        return user_cache[key]
-    for file in (IMAGINE_ENV, SYSTEM_ENV):
-        val = read_key(file, key)
-        if val is not None:
-            log_debug(CAT_FILE, f"read_merged_key: {key} = '{val}' ← from {file}")
-            return val
-    log_debug(CAT_FILE, f"read_merged_key: {key} NOT FOUND")
+    merged, source = merged_env()
+    if key in merged:
+        log_debug(CAT_FILE, lambda: f"read_merged_key: {key} = '{merged[key]}' ← from {source[key]}")
+        return merged[key]
+    log_debug(CAT_FILE, lambda: f"read_merged_key: {key} NOT FOUND")
     return None
 
+_merged_ints = (None, {})
+
+def read_merged_int(key, default=0):
+    # Integer-coerced merged key, memoized until merged_env hands out a rebuilt dict
+    global _merged_ints
+    merged = merged_env()[0]
+    owner, ints = _merged_ints
+    if owner is not merged:
+        ints = {}
+        _merged_ints = (merged, ints)
+    cache_key = (key, default)
+    if cache_key not in ints:
+        ints[cache_key] = safe_int(merged.get(key) or default, default)
+    return ints[cache_key]
+
+_ENV_INDEX = {}
+_ENV_LOCK = threading.Lock()
+
+def _env_lines(full_path):
+    # Lines of an env file, reused across updates until someone else touches the file
+    try:
+        st = os.stat(full_path)
+    except OSError:
+        _ENV_INDEX.pop(full_path, None)
+        return []
+    cached = _ENV_INDEX.get(full_path)
+    if cached and cached[0] == (st.st_mtime_ns, st.st_size):
+        return cached[1]
+    try:
+        lines = _text_lines(read_small_file(full_path), keepends=True)
+    except:
+        lines = []
+    _ENV_INDEX[full_path] = ((st.st_mtime_ns, st.st_size), lines)
+    return lines
+
+def _env_remember(full_path, lines):
+    try:
+        st = os.stat(full_path)
+        _ENV_INDEX[full_path] = ((st.st_mtime_ns, st.st_size), lines)
+    except OSError:
+        _ENV_INDEX.pop(full_path, None)
+
+_DIRTY_ENV_FILES = set()
+_env_flush_source = None
+
+def mark_env_dirty(full_path):
+    # fsync is coalesced: one barrier per path, 500 ms after the last edit; atomic rewrites pass their directory for the rename
+    global _env_flush_source
+    _DIRTY_ENV_FILES.add(full_path)
+    if _env_flush_source is None:
+        _env_flush_source = GLib.timeout_add(500, _env_flush_timeout)
+
+def _env_flush_timeout():
+    global _env_flush_source
+    _env_flush_source = None
+    return flush_env_files()
+
+def flush_env_files():
+    global _env_flush_source
+    with _ENV_LOCK:
+        paths = list(_DIRTY_ENV_FILES)
+        _DIRTY_ENV_FILES.clear()
+        if _env_flush_source is not None:
+            GLib.source_remove(_env_flush_source)
+            _env_flush_source = None
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            log_debug(CAT_FILE, f"flush_env_files: fsync failed on {path}: {e}")
+    return False
+
+def _env_line_value(line):
+    v = line.split('=', 1)[1].strip()
+    if len(v) >= 2 and v[0] == v[-1] and v[0] in '"\'':
+        v = v[1:-1]
+    return v
+
+def _line_sets(line, prefix):
+    # Assignments are almost never indented, so only lines starting with whitespace pay for lstrip()
+    return line.startswith(prefix) or (line[:1].isspace() and line.lstrip().startswith(prefix))
+
+def _env_holds(file, line, prefix, value):
+    # Skipping a write is only safe if the loader reads the same value back; it ignores indented assignments
+    return (line.startswith(prefix) and _env_line_value(line) == value
+            and load_env_cached(file).get(prefix[:-1]) == value)
+
 def update_env(file, key, value):
     full_path = os.path.join(SCRIPT_DIR, file)
-    log_debug(CAT_FILE, f"update_env: WRITING {key} = '{value}' to {full_path}")
-    lines = []
-    if os.path.exists(full_path):
+    log_debug(CAT_FILE, lambda: f"update_env: WRITING {key} = '{value}' to {full_path}")
+    new_line = f'{key}="{value}"\n'
+    prefix = key + '='
+    with _ENV_LOCK:
+        lines = _env_lines(full_path)
+        matches = [i for i, line in enumerate(lines) if _line_sets(line, prefix)]
+        if len(matches) == 1 and _env_holds(file, lines[matches[0]], prefix, str(value)):
+            log_debug(CAT_FILE, lambda: f"update_env: {key} unchanged in {full_path}, skip")
+            return
+        if len(matches) == 1 and len(lines[matches[0]].encode('utf-8')) == len(new_line.encode('utf-8')):
+            idx = matches[0]
+            old_line = lines[idx].encode('utf-8')
+            offset = sum(len(line.encode('utf-8')) for line in lines[:idx])
+            try:
+                fd = os.open(full_path, os.O_RDWR)
+                try:
+                    # Cached lines are newline-normalized; if the bytes on disk differ (CRLF files), the offset is wrong
+                    if os.pread(fd, len(old_line), offset) != old_line:
+                        raise ValueError("on-disk line does not match cached offset")
+                    os.pwrite(fd, new_line.encode('utf-8'), offset)
+                finally:
+                    os.close(fd)
+                lines = lines[:]
+                lines[idx] = new_line
+                _env_remember(full_path, lines)
+                mark_env_dirty(full_path)
+                # A same-size write inside one timestamp tick can keep the stamp, so this file's parse is dropped explicitly
+                _ENV_PARSED.pop(file, None)
+                log_debug(CAT_FILE, lambda: f"update_env: SUCCESS rewrote {key} in place in {full_path}")
+                return
+            except Exception as e:
+                log_debug(CAT_FILE, f"update_env: in-place write failed, rewriting {full_path}: {e}")
+        lines = [line for line in lines if not _line_sets(line, prefix)]
+        lines.append(new_line)
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-        except:
-            lines = []
-    lines = [line for line in lines if not line.strip().startswith(f'{key}=')]
-    lines.append(f'{key}="{value}"\n')
-    try:
-        with open(full_path, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
-            f.flush()
-            os.fsync(f.fileno())
-        log_debug(CAT_FILE, f"update_env: SUCCESS wrote {key} to {full_path}")
-    except Exception as e:
-        log_debug(CAT_FILE, f"update_env: ERROR writing to {full_path}: {e}")
+            write_file_atomic(full_path, ''.join(lines).encode('utf-8'))
+            _env_remember(full_path, lines)
+            mark_env_dirty(os.path.dirname(full_path))
+            _ENV_PARSED.pop(file, None)
+            log_debug(CAT_FILE, lambda: f"update_env: SUCCESS wrote {key} to {full_path}")
+        except Exception as e:
+            _ENV_INDEX.pop(full_path, None)
+            log_debug(CAT_FILE, f"update_env: ERROR writing to {full_path}: {e}")
+
+def update_env_many(file, updates):
+    # One read-modify-write for several keys; a value of None removes the key
+    full_path = os.path.join(SCRIPT_DIR, file)
+    if not updates:
+        return
+    log_debug(CAT_FILE, lambda: f"update_env_many: WRITING {len(updates)} keys to {full_path}")
+    with _ENV_LOCK:
+        lines = _env_lines(full_path)
+        pending = {}
+        for key, value in updates.items():
+            prefix = key + '='
+            matches = [line for line in lines if _line_sets(line, prefix)]
+            if value is None:
+                if matches:
+                    pending[key] = None
+            elif len(matches) != 1 or not _env_holds(file, matches[0], prefix, str(value)):
+                pending[key] = value
+        if not pending:
+            log_debug(CAT_FILE, lambda: f"update_env_many: nothing changed in {full_path}, skip")
+            return
+        prefixes = tuple(key + '=' for key in pending)
+        lines = [line for line in lines if not _line_sets(line, prefixes)]
+        lines.extend(f'{key}="{value}"\n' for key, value in pending.items() if value is not None)
+        try:
+            write_file_atomic(full_path, ''.join(lines).encode('utf-8'))
+            _env_remember(full_path, lines)
+            mark_env_dirty(os.path.dirname(full_path))
+            _ENV_PARSED.pop(file, None)
+            log_debug(CAT_FILE, lambda: f"update_env_many: SUCCESS wrote {', '.join(pending)} to {full_path}")
+        except Exception as e:
+            _ENV_INDEX.pop(full_path, None)
+            log_debug(CAT_FILE, f"update_env_many: ERROR writing to {full_path}: {e}")
 
-def prune_env(env_file, keep_prefixes=None, runtime_keys=None):
+def prune_env(env_file, keep_prefixes=None, runtime_keys=None, system_values=None):
     log_debug(CAT_FILE, f"prune_env: STARTING prune on {env_file}")
-    system_values = load_env_multiline(SYSTEM_ENV)
+    if system_values is None:
+        system_values = load_env_cached(SYSTEM_ENV)
+    keep_prefixes = tuple(keep_prefixes) if keep_prefixes else ()
     full_path = os.path.join(SCRIPT_DIR, env_file)
-    if not os.path.exists(full_path):
-        log_debug(CAT_FILE, f"prune_env: file missing - skip {full_path}")
-        return
-    lines = []
-    kept = 0
-    pruned = 0
-    try:
-        with open(full_path, 'r', encoding='utf-8') as f:
-            old_lines = f.readlines()
-        for raw_line in old_lines:
-            line = raw_line.rstrip('\n')
-            stripped = line.strip()
-            if not stripped or stripped.startswith('#'):
-                lines.append(raw_line)
-                kept += 1
-                continue
-            m = re.match(r'^([A-Za-z_][A-Za-z0-9_]*)=(.*)$', line)
-            if not m:
-                lines.append(raw_line)
-                kept += 1
-                continue
-            key = m.group(1)
-            if keep_prefixes and any(key.startswith(p) for p in keep_prefixes):
-                lines.append(raw_line)
-                kept += 1
-                continue
-            if runtime_keys and key in runtime_keys:
-                lines.append(raw_line)
-                kept += 1
-                continue
-            rest = m.group(2).lstrip()
-            value_part = rest.split('#', 1)[0].strip()
-            parsed_value = value_part.strip('"\'')
-            if key not in system_values:
+    with _ENV_LOCK:
+        lines = []
+        kept = 0
+        pruned = 0
+        try:
+            for raw_line in _text_lines(read_small_file(full_path), keepends=True):
+                line = raw_line.rstrip('\n')
+                stripped = line.strip()
+                if not stripped or stripped.startswith('#'):
+                    lines.append(raw_line)
+                    kept += 1
+                    continue
+                eq = line.find('=')
+                key = line[:eq] if eq > 0 else ''
+                if not (key.isascii() and key.isidentifier()):
+                    lines.append(raw_line)
+                    kept += 1
+                    continue
+                if keep_prefixes and key.startswith(keep_prefixes):
+                    lines.append(raw_line)
+                    kept += 1
+                    continue
+                if runtime_keys and key in runtime_keys:
+                    lines.append(raw_line)
+                    kept += 1
+                    continue
+                rest = line[eq + 1:].lstrip()
+                value_part = rest.split('#', 1)[0].strip()
+                parsed_value = value_part.strip('"\'')
+                if key not in system_values:
+                    lines.append(raw_line)
+                    kept += 1
+                    continue
+                sys_val = system_values[key]
+                if parsed_value == sys_val:
+                    log_debug(CAT_FILE, lambda: f"prune_env: PRUNING redundant {key} = '{parsed_value}' from {env_file}")
+                    pruned += 1
+                    continue
                 lines.append(raw_line)
                 kept += 1
-                continue
-            sys_val = system_values[key]
-            if parsed_value == sys_val:
-                log_debug(CAT_FILE, f"prune_env: PRUNING redundant {key} = '{parsed_value}' from {env_file}")
-                pruned += 1
-                continue
-            lines.append(raw_line)
-            kept += 1
-        with open(full_path, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
-        log_debug(CAT_FILE, f"prune_env: COMPLETE on {env_file} — kept {kept}, pruned {pruned}")
-    except Exception as e:
-        log_debug(CAT_FILE, f"prune_env: ERROR on {env_file}: {e}")
+            if not pruned:
+                log_debug(CAT_FILE, f"prune_env: nothing to prune in {env_file} — kept {kept}, file untouched")
+                return
+            write_file_atomic(full_path, ''.join(lines).encode('utf-8'))
+            _env_remember(full_path, lines)
+            mark_env_dirty(os.path.dirname(full_path))
+            _ENV_PARSED.pop(env_file, None)
+            log_debug(CAT_FILE, f"prune_env: COMPLETE on {env_file} — kept {kept}, pruned {pruned}")
+        except FileNotFoundError:
+            log_debug(CAT_FILE, f"prune_env: file missing - skip {full_path}")
+        except Exception as e:
+            log_debug(CAT_FILE, f"prune_env: ERROR on {env_file}: {e}")
+
+def load_url_set(path):
+    # One-URL-per-line list file, read in a single os.read and split in memory
+    urls = set()
+    for line in _text_lines(read_small_file(path)):
+        line = line.strip()
+        if line:
+            urls.add(line)
+    return urls
+
+def prefetch_files(paths):
+    # Queue kernel readahead for every file up front so the serial reads that follow hit page cache
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+@functools.lru_cache(maxsize=4096)
+def _quote_url(url):
+    return urllib.parse.quote(url, safe='')
+
+@functools.lru_cache(maxsize=8)
+def _dir_names(directory, mtime_ns):
+    try:
+        return frozenset(os.listdir(directory))
+    except OSError:
+        return frozenset()
+
+def dir_entries(directory):
+    # One listing per directory change; thumbnail probes become set lookups instead of a stat each
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    except OSError:
+        return frozenset()
+    return _dir_names(directory, mtime_ns)
 
+prefetch_files([os.path.join(SCRIPT_DIR, p) for p in (USER_ENV, IMAGINE_ENV, SYSTEM_ENV)])
 user_cache = load_env_multiline(USER_ENV)
 log_debug(CAT_FILE, f"user_cache loaded with {len(user_cache)} keys")
 
@@ -260,31 +581,258 @@ clean_workbench_cruft()
 
 def dedupe_and_prune_startup():
     log_debug(CAT_INIT, "=== STARTUP PRUNE BEGIN ===")
-    prune_env(USER_ENV, keep_prefixes=['ENV_EDITOR_', 'GXI_EDITOR_', 'PANEL_DEFAULT_'])
-    prune_env(IMAGINE_ENV, runtime_keys=RUNTIME_KEYS)
+    system_values = load_env_cached(SYSTEM_ENV)
+    prune_env(USER_ENV, keep_prefixes=('ENV_EDITOR_', 'GXI_EDITOR_', 'PANEL_DEFAULT_'), system_values=system_values)
+    prune_env(IMAGINE_ENV, runtime_keys=RUNTIME_KEYS, system_values=system_values)
     log_debug(CAT_INIT, "=== STARTUP PRUNE COMPLETE ===")
 
+STYLE_CSS = os.path.join(SCRIPT_DIR, 'blitz_talker_style.css')
+STYLE_GRESOURCE = os.path.join(SCRIPT_DIR, 'blitz_talker_style.gresource')
+STYLE_RESOURCE_PATH = '/blitz/blitz_talker_style.css'
+
+_style_resource = None
+
+def load_style(css_provider):
+    # Prefer the compiled bundle (glib-compile-resources blitz_talker_style.gresource.xml); fall back to the plain file
+    global _style_resource
+    try:
+        if _style_resource is None:
+            _style_resource = Gio.Resource.load(STYLE_GRESOURCE)
+            Gio.resources_register(_style_resource)
+        css_provider.load_from_resource(STYLE_RESOURCE_PATH)
+        log_debug(CAT_INIT, f"CSS loaded from resource {STYLE_GRESOURCE}")
+        return
+    except Exception as e:
+        log_debug(CAT_INIT, f"CSS resource unavailable, using {STYLE_CSS}: {e}")
+    try:
+        css_provider.load_from_path(STYLE_CSS)
+    except Exception as e:
+        log_debug(CAT_INIT, f"CSS load failed: {e}")
+
 def load_flags(key):
     flags_str = get_merged_multiline(key)
-    return shlex.split(flags_str) if flags_str else []
+    if not flags_str:
+        return []
+    # Only staging needs shell-style splitting, so the import waits for the first launch
+    import shlex
+    return shlex.split(flags_str)
+
+_clipboard = None
+
+def gtk_clipboard():
+    global _clipboard
+    if _clipboard is None:
+        _clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
+    return _clipboard
+
+def run_on_main_thread(func, timeout=2):
+    # GTK objects are main-thread only; worker threads hand the call over and wait for it
+    if threading.current_thread() is threading.main_thread():
+        return func()
+    result = {}
+    done = threading.Event()
+    lock = threading.Lock()
+    def call():
+        # A request the caller gave up on must not run late, e.g. a stale set after the xclip fallback wrote
+        with lock:
+            if result.get('cancelled'):
+                return False
+            result['started'] = True
+        try:
+            result['value'] = func()
+        except Exception as e:
+            result['error'] = e
+        finally:
+            done.set()
+        return False
+    GLib.idle_add(call)
+    if not done.wait(timeout):
+        with lock:
+            if not result.get('started'):
+                result['cancelled'] = True
+                raise TimeoutError("main loop did not service clipboard request")
+        done.wait()
+    if 'error' in result:
+        raise result['error']
+    return result.get('value')
 
 def get_clipboard():
+    try:
+        return (run_on_main_thread(lambda: gtk_clipboard().wait_for_text()) or '').strip()
+    except Exception as e:
+        log_debug(CAT_INPUT, f"GTK clipboard read failed, falling back to xclip: {e}")
     try:
         return subprocess.check_output(['xclip', '-selection', 'clipboard', '-o'], timeout=2).decode('utf-8').strip()
     except:
         return ''
 
 def clipboard_set(text):
+    def set_text():
+        cb = gtk_clipboard()
+        cb.set_text(text, -1)
+        cb.store()
+    try:
+        run_on_main_thread(set_text)
+        return
+    except Exception as e:
+        log_debug(CAT_INPUT, f"GTK clipboard write failed, falling back to xclip: {e}")
     try:
         subprocess.run(['xclip', '-selection', 'clipboard'], input=text.encode('utf-8'), check=True)
     except:
         pass
 
-def xdo_resize_move(wid, width, height, x, y):
+_xdisplay = None
+
+def x_display():
+    # One persistent X connection when python-xlib is installed; None means use xdotool
+    global _xdisplay
+    if _xdisplay is None:
+        _xdisplay = False
+        if xlib_display is not None:
+            try:
+                _xdisplay = xlib_display.Display()
+            except Exception as e:
+                log_debug(CAT_XDO, f"XLIB: display open failed, using xdotool: {e}")
+    return _xdisplay or None
+
+def x_sync():
+    d = x_display()
+    if d:
+        d.sync()
+
+def x_map_watch(callback):
+    # Separate X connection selecting SubstructureNotify on the root; callback runs on the main loop when windows map
+    if xlib_display is None:
+        return None
+    try:
+        d = xlib_display.Display()
+        d.screen().root.change_attributes(event_mask=X.SubstructureNotifyMask)
+        d.sync()
+    except Exception as e:
+        log_debug(CAT_XDO, f"XLIB: map watch unavailable, polling only: {e}")
+        return None
+
+    def on_readable(*_):
+        mapped = False
+        try:
+            while d.pending_events():
+                if d.next_event().type == X.MapNotify:
+                    mapped = True
+        except Exception as e:
+            log_debug(CAT_XDO, f"XLIB: map watch read failed: {e}")
+            return False
+        if mapped:
+            callback()
+        return True
+
+    source = GLib.io_add_watch(d.fileno(), GLib.PRIORITY_DEFAULT, GLib.IOCondition.IN, on_readable)
+    return d, source
+
+def x_map_unwatch(watch):
+    if not watch:
+        return
+    d, source = watch
+    if GLib.MainContext.default().find_source_by_id(source):
+        GLib.source_remove(source)
+    try:
+        d.close()
+    except Exception:
+        pass
+
+def x_close_windows(wids):
+    # _NET_CLOSE_WINDOW for every wid in one flush; False means the caller should fall back to wmctrl
+    d = x_display()
+    if not d or not wids:
+        return False
+    try:
+        root = d.screen().root
+        net_close = d.intern_atom('_NET_CLOSE_WINDOW')
+        mask = X.SubstructureRedirectMask | X.SubstructureNotifyMask
+        for wid in wids:
+            win = d.create_resource_object('window', int(str(wid), 0))
+            ev = xlib_event.ClientMessage(window=win, client_type=net_close, data=(32, [X.CurrentTime, 1, 0, 0, 0]))
+            root.send_event(ev, event_mask=mask)
+        d.flush()
+        return True
+    except Exception as e:
+        log_debug(CAT_XDO, f"XLIB: close request failed, using wmctrl: {e}")
+        return False
+
+def xdo_resize_move(wid, width, height, x, y, sync=True):
+    d = x_display()
+    if d:
+        try:
+            win = d.create_resource_object('window', int(str(wid), 0))
+            win.configure(x=x, y=y, width=width, height=height)
+            if sync:
+                d.sync()
+            return
+        except Exception as e:
+            log_debug(CAT_XDO, f"XLIB: configure failed on {wid}, using xdotool: {e}")
     cmd = ['xdotool', 'windowsize', '--sync', wid, str(width), str(height),
            'windowmove', wid, str(x), str(y)]
     subprocess.run(cmd, capture_output=True, text=True)
 
+def xdo_resize_move_many(moves, sync=True):
+    # moves are (wid, width, height, x, y); one X flush, or one chained xdotool process, for the whole batch
+    if not moves:
+        return
+    d = x_display()
+    if d:
+        try:
+            for wid, width, height, x, y in moves:
+                win = d.create_resource_object('window', int(str(wid), 0))
+                win.configure(x=x, y=y, width=width, height=height)
+            if sync:
+                d.sync()
+            return
+        except Exception as e:
+            log_debug(CAT_XDO, f"XLIB: batch configure failed, using xdotool: {e}")
+    cmd = ['xdotool']
+    for wid, width, height, x, y in moves:
+        cmd += ['windowsize', '--sync', wid, str(width), str(height), 'windowmove', wid, str(x), str(y)]
+    subprocess.run(cmd, capture_output=True, text=True)
+
+def window_names(wids):
+    # Titles for many windows over the open X connection; xdotool per window only without python-xlib
+    d = x_display()
+    if d:
+        try:
+            net_wm_name = d.intern_atom('_NET_WM_NAME')
+            utf8 = d.intern_atom('UTF8_STRING')
+            names = {}
+            for wid in wids:
+                try:
+                    win = d.create_resource_object('window', int(wid))
+                    prop = win.get_full_property(net_wm_name, utf8)
+                    name = prop.value if prop else win.get_wm_name()
+                    if isinstance(name, bytes):
+                        name = name.decode('utf-8', 'replace')
+                    names[wid] = (name or '').strip()
+                except Exception:
+                    names[wid] = ''
+            return names
+        except Exception as e:
+            log_debug(CAT_XDO, f"XLIB: window name lookup failed, using xdotool: {e}")
+    names = {}
+    for wid in wids:
+        log_debug(CAT_XDO, f"XDO: getwindowname {wid}")
+        name_res = subprocess.run(['xdotool', 'getwindowname', wid], capture_output=True, text=True)
+        names[wid] = name_res.stdout.strip()
+    return names
+
+FIRE_KEYS = ('Control+a', 'Delete', 'Control+v', 'Return')
+ERASE_KEYS = ('Control+a', 'Delete', 'Return')
+
+def xdo_key(wid, keys, delay=None):
+    # Every keystroke for a shot goes through one xdotool process
+    cmd = ['xdotool', 'key', '--window', str(wid)]
+    if delay is not None:
+        cmd += ['--delay', str(delay)]
+    cmd.extend(keys)
+    log_debug(CAT_XDO, lambda: f"XDO: {' '.join(cmd)}")
+    return subprocess.run(cmd, capture_output=True, text=True)
+
 def get_urls_from_input(input_str):
     input_str = input_str.strip()
     urls = []
@@ -298,48 +846,111 @@ def get_urls_from_input(input_str):
         except:
             pass
     else:
-        parts = re.split(r'[,\s]+', input_str)
+        parts = input_str.translate(_URL_SPLIT_TABLE).split()
         for p in parts:
             p = p.strip().strip('"\'')
             if p and '://' in p:
                 urls.append(p)
     return urls
 
-def parse_gxi(path):
-    if not os.path.exists(path):
-        return [], {'U':[], '1':[], '2':[], '3':[]}, {'U':[], '1':[], '2':[], '3':[]}, ""
+_GXI_STAGE_ORDER = ('U', '1', '2', '3')
+_GXI_FIRE_ORDER = ('1', '2', '3', 'U')
+_GXI_STAGE_MARKERS = frozenset('STAGE_' + stage for stage in _GXI_STAGE_ORDER)
+_GXI_HEADER_PREFIXES = ('TARGET_URL=', 'BORN_ON=', 'ACCOUNT=', 'TARGET_DESC=')
+_GXI_TEMPLATE_TAIL = b"ACCOUNT=\nTARGET_DESC=\n\n" + b"".join(
+    f"STAGE_{stage}\n\n.history_{stage}\n\n".encode() for stage in _GXI_STAGE_ORDER)
+
+# First character of every marker line; prompt and history text rarely starts with one, so most lines stop here
+_GXI_MARKER_FIRST = frozenset(m[0] for m in (*_GXI_STAGE_MARKERS, *_GXI_HEADER_PREFIXES, '.history_'))
+
+def _gxi_is_marker(line):
+    first = line[:1]
+    if first.isspace():
+        first = line.lstrip()[:1]
+    if first not in _GXI_MARKER_FIRST:
+        return False
+    stripped = line.strip()
+    return stripped in _GXI_STAGE_MARKERS or stripped.startswith(_GXI_HEADER_PREFIXES) or stripped.startswith('.history_')
+
+def parse_gxi(path, size=None):
     header_lines = []
     prompts = {'U':[], '1':[], '2':[], '3':[]}
     histories = {'U':[], '1':[], '2':[], '3':[]}
     comment = ""
     current_stage = None
     in_history = False
+    # A caller that already stat()ed an empty file skips the open entirely
+    if size == 0:
+        return header_lines, prompts, histories, comment
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith('TARGET_URL=') or stripped.startswith('BORN_ON=') or stripped.startswith('ACCOUNT='):
-                header_lines.append(line)
-            elif stripped.startswith('TARGET_DESC='):
-                header_lines.append(line)
-                comment = stripped[12:].strip()
-            elif stripped in ['STAGE_U', 'STAGE_1', 'STAGE_2', 'STAGE_3']:
-                current_stage = stripped[6:]
-                in_history = False
-            elif stripped.startswith('.history_'):
-                in_history = True
-            elif current_stage:
-                if in_history:
-                    histories[current_stage].append(line.rstrip('\n'))
+        # Stray non-UTF-8 bytes survive as surrogates so write_gxi puts them back instead of emptying the file
+        lines = _text_lines(read_small_file(path), keepends=True, errors='surrogateescape')
+        # Runs of plain lines between markers land in one list with a single extend
+        for is_marker, run in itertools.groupby(lines, key=_gxi_is_marker):
+            if not is_marker:
+                if not current_stage:
+                    header_lines.extend(run)
+                elif in_history:
+                    histories[current_stage].extend(line.rstrip('\n') for line in run)
                 else:
-                    prompts[current_stage].append(line.rstrip('\n'))
-            else:
-                header_lines.append(line)
+                    prompts[current_stage].extend(line.rstrip('\n') for line in run)
+                continue
+            for line in run:
+                stripped = line.strip()
+                if stripped.startswith('TARGET_DESC='):
+                    header_lines.append(line)
+                    comment = stripped[12:].strip()
+                elif stripped.startswith(_GXI_HEADER_PREFIXES):
+                    header_lines.append(line)
+                elif stripped in _GXI_STAGE_MARKERS:
+                    current_stage = stripped[6:]
+                    in_history = False
+                else:
+                    in_history = True
     except:
         pass
     return header_lines, prompts, histories, comment
 
+_GXI_CACHE = {}
+
+def parse_gxi_cached(path):
+    # Unchanged files are parsed once; callers get their own copies of the lists to mutate
+    try:
+        st = os.stat(path)
+    except OSError:
+        _GXI_CACHE.pop(path, None)
+        return parse_gxi(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _GXI_CACHE.get(path)
+    if cached and cached[0] == stamp:
+        header_lines, prompts, histories, comment = cached[1]
+    else:
+        header_lines, prompts, histories, comment = parse_gxi(path, st.st_size)
+        _GXI_CACHE[path] = (stamp, (header_lines, prompts, histories, comment))
+    return (list(header_lines), {k: list(v) for k, v in prompts.items()},
+            {k: list(v) for k, v in histories.items()}, comment)
+
+def read_gxi_header(path):
+    # Header-only readers stop at the first stage marker instead of pulling in every history
+    try:
+        st = os.stat(path)
+    except OSError:
+        return []
+    cached = _GXI_CACHE.get(path)
+    if cached and cached[0] == (st.st_mtime_ns, st.st_size):
+        return list(cached[1][0])
+    header_lines = []
+    try:
+        for line in _text_lines(read_small_file(path), keepends=True, errors='surrogateescape'):
+            stripped = line.strip()
+            if stripped in _GXI_STAGE_MARKERS:
+                break
+            if not stripped.startswith('.history_'):
+                header_lines.append(line)
+    except:
+        pass
+    return header_lines
+
 def write_gxi(path, header_lines, prompts, histories, comment):
     new_header = [line for line in header_lines if not line.strip().startswith('TARGET_DESC=')]
     if comment:
@@ -348,7 +959,7 @@ def write_gxi(path, header_lines, prompts, histories, comment):
         for cl in comment_lines[1:]:
             new_header.append(cl + '\n')
     new_header.append("\n")
-    for stage in ['U', '1', '2', '3']:
+    for stage in _GXI_STAGE_ORDER:
         new_header.append(f"STAGE_{stage}\n")
         for p in prompts.get(stage, []):
             new_header.append(p + '\n')
@@ -357,49 +968,55 @@ def write_gxi(path, header_lines, prompts, histories, comment):
         for h in histories.get(stage, []):
             new_header.append(h + '\n')
         new_header.append("\n")
+    # The whole file goes out as one buffer in one write instead of a writelines pass over short strings
+    blob = ''.join(new_header).encode('utf-8', 'surrogateescape')
     try:
-        with open(path, 'w', encoding='utf-8') as f:
-            f.writelines(new_header)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+        try:
+            view = memoryview(blob)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
     except:
         pass
+    _GXI_CACHE.pop(path, None)
 
 def apply_overflow(prompts):
-    order = ['U', '1', '2', '3']
-    for i in range(len(order) - 1):
-        stage = order[i]
-        while len(prompts[stage]) > 5:
-            overflow = prompts[stage].pop()
-            prompts[order[i+1]].insert(0, overflow)
+    for stage, next_stage in zip(_GXI_STAGE_ORDER, _GXI_STAGE_ORDER[1:]):
+        if len(prompts[stage]) > 5:
+            prompts[next_stage][:0] = prompts[stage][5:]
+            del prompts[stage][5:]
+
+_DEDUPE_NEXT_STAGE = {'1': '2', '2': '3', '3': 'U', 'U': None}
 
 def dedupe_prompts(prompts):
-    seen = {}
+    seen = set()
     new_prompts = {'U':[], '1':[], '2':[], '3':[]}
-    order = ['1', '2', '3', 'U']
-    for stage in order:
-        for p in prompts.get(stage, []):
+    for stage in _DEDUPE_NEXT_STAGE:
+        kept = new_prompts[stage]
+        for p in prompts.get(stage, ()):
+            # lstrip hands back p itself when there is no '@', so plain prompts allocate nothing
             clean = p.lstrip('@')
             if clean in seen:
                 continue
-            seen[clean] = True
-            if p.startswith('@'):
-                new_prompts[stage].append(p)
-            else:
-                new_prompts[stage].append(clean)
-    for stage in order:
-        while len(new_prompts[stage]) > 5:
-            overflow = new_prompts[stage].pop()
-            if stage == 'U':
-                continue
-            next_idx = order.index(stage) + 1
-            next_stage = order[next_idx]
-            new_prompts[next_stage].insert(0, overflow)
+            seen.add(clean)
+            kept.append(p)
+    for stage, next_stage in _DEDUPE_NEXT_STAGE.items():
+        kept = new_prompts[stage]
+        if len(kept) <= 5:
+            continue
+        if next_stage:
+            new_prompts[next_stage][:0] = kept[5:]
+        del kept[5:]
     return new_prompts
 
 class BlitzControl(Gtk.Box):
-    def __init__(self, parent_app, startup_source=None):
+    def __init__(self, parent_app, startup_kind=None, startup_value=None, startup_urls=None):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         self.parent_app = parent_app
         self.set_border_width(10)
+        self._merged_env, self._key_source = merged_env()
         self.busy = False
         self.firing = False
         self.daemon_thread = None
@@ -408,32 +1025,51 @@ class BlitzControl(Gtk.Box):
         self.gun_active_urls = set()
         self.current_wids = []
         self.cycle_urls = []
-        self.target_dir = os.path.join(SCRIPT_DIR, read_merged_key('TARGET_DIR') or '.imagine_targets')
+        self.target_dir = os.path.join(SCRIPT_DIR, self._merged_env.get('TARGET_DIR') or '.imagine_targets')
         os.makedirs(self.target_dir, exist_ok=True)
         self.workbench_dir = os.path.join(SCRIPT_DIR, '.imagine_workbench')
         os.makedirs(self.workbench_dir, exist_ok=True)
-        self.archive_dir = os.path.join(SCRIPT_DIR, read_merged_key('ARCHIVE_DIR') or '.imagine_archives')
+        self.archive_dir = os.path.join(SCRIPT_DIR, self._merged_env.get('ARCHIVE_DIR') or '.imagine_archives')
         os.makedirs(self.archive_dir, exist_ok=True)
         self.current_dir = self.target_dir
         self.is_archive = False
-        self.target_list_file = os.path.join(SCRIPT_DIR, read_merged_key('TARGET_LIST') or 'live_windows.txt')
-        self.gun_list_file = os.path.join(SCRIPT_DIR, read_merged_key('GUN_LIST') or 'gun_active_windows.txt')
-        if os.path.exists(self.target_list_file):
-            try:
-                with open(self.target_list_file, 'r', encoding='utf-8') as f:
-                    self.batch_urls = {line.strip() for line in f if line.strip()}
-            except: pass
-        if os.path.exists(self.gun_list_file):
-            try:
-                with open(self.gun_list_file, 'r', encoding='utf-8') as f:
-                    self.gun_active_urls = {line.strip() for line in f if line.strip()}
-            except: pass
+        self.target_list_file = os.path.join(SCRIPT_DIR, self._merged_env.get('TARGET_LIST') or 'live_windows.txt')
+        self.gun_list_file = os.path.join(SCRIPT_DIR, self._merged_env.get('GUN_LIST') or 'gun_active_windows.txt')
+        prefetch_files([self.target_list_file, self.gun_list_file])
+        try:
+            self.batch_urls = load_url_set(self.target_list_file)
+        except: pass
+        try:
+            self.gun_active_urls = load_url_set(self.gun_list_file)
+        except: pass
         self.all_urls = []
         self.gxi_paths = {}
         self.wb_gxi_paths = {}
         self.gallery_checks = {}
         self.carousel_gun_checks = {}
         self.row_widgets = {}
+        self.gallery_pool = []
+        self.carousel_pool = []
+        self._thumb_cache = OrderedDict()
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._thumb_pool = ThreadPoolExecutor(max_workers=2)
+        self._gxi_load_source = None
+        self._push_future = None
+        self._pending_merge = {}
+        self._gxi_loaded_once = False
+        self._prompt_map_dirty = False
+        self._selected_carousel_row = None
+        self._pending_save_source = {}
+        self._display_geom = None
+        self._monitor_geom = None
+        self._auto_fire_pending = False
+        screen = Gdk.Screen.get_default()
+        if screen:
+            screen.connect('size-changed', lambda *_: self._invalidate_display_geoms())
+        display = Gdk.Display.get_default()
+        if display:
+            display.connect('monitor-added', lambda *_: self._invalidate_display_geoms())
+            display.connect('monitor-removed', lambda *_: self._invalidate_display_geoms())
         self.current_gxi_path = None
         self.current_histories = {}
         self.updating_merged = False
@@ -442,9 +1078,9 @@ class BlitzControl(Gtk.Box):
         self.filter_mode = 0
         self.mass_updating = False
 
-        self.PROMPT_ERASE_CHAR  = read_merged_key('PROMPT_ERASE_CHAR')  or '~'
-        self.PROMPT_SILENT_CHAR = read_merged_key('PROMPT_SILENT_CHAR') or '#'
-        self.PROMPT_FIRE_CHAIN  = (read_merged_key('PROMPT_FIRE_CHAIN') or 'true').lower() == 'true'
+        self.PROMPT_ERASE_CHAR  = self._merged_env.get('PROMPT_ERASE_CHAR')  or '~'
+        self.PROMPT_SILENT_CHAR = self._merged_env.get('PROMPT_SILENT_CHAR') or '#'
+        self.PROMPT_FIRE_CHAIN  = (self._merged_env.get('PROMPT_FIRE_CHAIN') or 'true').lower() == 'true'
 
         update_env(IMAGINE_ENV, 'FIRE_MODE', 'N')
 
@@ -491,13 +1127,13 @@ class BlitzControl(Gtk.Box):
         main_box.pack_start(live_comment_row, False, False, 0)
 
         self.send_prompt_check = Gtk.CheckButton(label="Send (uncheck to regen)")
-        send_val = read_merged_key('SEND_PROMPT_ON_FIRE') or '1'
-        self.send_prompt_check.set_active(send_val.lower() in ('1', 'y', 'true', 'yes', 'on'))
+        send_val = self._merged_env.get('SEND_PROMPT_ON_FIRE') or '1'
+        self.send_prompt_check.set_active(is_truthy(send_val))
         self.send_prompt_check.connect("toggled", self.on_send_prompt_toggled)
 
         self.harvest_prompt_check = Gtk.CheckButton(label="Harvest")
-        harvest_val = read_merged_key('HARVEST_PROMPT_ON_STAGE') or '1'
-        self.harvest_prompt_check.set_active(harvest_val.lower() in ('1', 'y', 'true', 'yes', 'on'))
+        harvest_val = self._merged_env.get('HARVEST_PROMPT_ON_STAGE') or '1'
+        self.harvest_prompt_check.set_active(is_truthy(harvest_val))
         self.harvest_prompt_check.connect("toggled", self.on_harvest_prompt_toggled)
 
         self.acct_entry = Gtk.Entry()
@@ -538,7 +1174,7 @@ class BlitzControl(Gtk.Box):
         rounds_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
         rounds_label = Gtk.Label(label="Rounds:")
         rounds_box.pack_start(rounds_label, False, False, 0)
-        fire_count_val = safe_int(read_merged_key('FIRE_COUNT') or 1)
+        fire_count_val = safe_int(self._merged_env.get('FIRE_COUNT') or 1)
         self.fire_spin = Gtk.SpinButton(adjustment=Gtk.Adjustment(value=fire_count_val, lower=1, upper=999, step_increment=1))
         self.fire_spin.set_width_chars(4)
         rounds_box.pack_start(self.fire_spin, False, False, 0)
@@ -547,7 +1183,7 @@ class BlitzControl(Gtk.Box):
         targets_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
         targets_label = Gtk.Label(label="Targets:")
         targets_box.pack_start(targets_label, False, False, 0)
-        stage_count_val = safe_int(read_merged_key('STAGE_COUNT') or 24)
+        stage_count_val = safe_int(self._merged_env.get('STAGE_COUNT') or 24)
         self.stage_spin = Gtk.SpinButton(adjustment=Gtk.Adjustment(value=stage_count_val, lower=1, upper=2000, step_increment=1))
         self.stage_spin.set_width_chars(4)
         targets_box.pack_start(self.stage_spin, False, False, 0)
@@ -566,35 +1202,13 @@ class BlitzControl(Gtk.Box):
         bottom_box.pack_start(quit_btn, False, False, 0)
 
         css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-        window { background-color: #2b2b2b; color: #f0f0f0; }
-        label.heading { font-weight: bold; color: #ffffff; padding: 8px; }
-        label.key-label { font-weight: bold; background-color: #3a3a3a; padding: 8px; }
-        frame { margin: 4px; border-radius: 4px; }
-        frame.system-column { background-color: #353535; }
-        frame.imagine-column { background-color: #404040; }
-        frame.user-column { background-color: #505050; }
-        frame.merged-column { background-color: #606060; }
-        textview, entry, spinbutton { background-color: #454545; color: #f0f0f0; border: 1px solid #555; }
-        textview text, entry text { color: #f0f0f0; }
-        button { background-color: #555; color: #fff; border-radius: 4px; }
-        button:hover { background-color: #666; }
-        eventbox { background-color: #2e2e2e; margin: 4px; border-radius: 4px; border: 2px solid transparent; }
-        eventbox.active-row { background-color: #335533; border-color: #66ff66; }
-        eventbox.selected { background-color: #333366; border-color: #6666ff; }
-        eventbox.selected.active-row { background-color: #444477; border-color: #9999ff; }
-        button.missing-thumb {
-            border: 2px dashed #888888;
-            background-color: transparent;
-        }
-        label.url-label { color: #88ccff; }
-        """)
+        load_style(css_provider)
         Gtk.StyleContext.add_provider_for_screen(Gdk.Screen.get_default(), css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
 
         self.gallery_window = Gtk.Window(title="Gallery")
         self.gallery_window.set_resizable(True)
         self.gallery_window.connect("delete-event", lambda w, e: self.hide_and_save_editor(w, 'GALLERY') or True)
-        self.gallery_window.connect("configure-event", lambda w, e: self.save_editor_geometry(w, 'GALLERY_EDITOR') or False)
+        self.gallery_window.connect("configure-event", lambda w, e: self.schedule_geom_save('GALLERY_EDITOR', w))
         gallery_vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         gallery_top = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         gallery_top.set_margin_top(10)
@@ -632,7 +1246,7 @@ class BlitzControl(Gtk.Box):
         self.gxi_window = Gtk.Window(title="GXI Manager")
         self.gxi_window.set_resizable(True)
         self.gxi_window.connect("delete-event", lambda w, e: self.hide_and_save_editor(w, 'GXI') or True)
-        self.gxi_window.connect("configure-event", lambda w, e: self.save_editor_geometry(w, 'GXI_EDITOR') or False)
+        self.gxi_window.connect("configure-event", lambda w, e: self.schedule_geom_save('GXI_EDITOR', w))
         gxi_paned = Gtk.Paned(orientation=Gtk.Orientation.HORIZONTAL)
         self.gxi_paned = gxi_paned
         gxi_paned.set_position(500)
@@ -750,10 +1364,12 @@ class BlitzControl(Gtk.Box):
         stages_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         stages_box.set_border_width(8)
         stages_frame.add(stages_box)
+        self.stages_box = stages_box
         self.gxi_editor_box.pack_start(stages_frame, False, False, 0)
         self.stage_checks = {}
         self.stage_entries = {}
-        for stage in ['1', '2', '3', 'U']:
+        self.stage_widgets = []
+        for stage in _GXI_FIRE_ORDER:
             stage_frame = Gtk.Frame(label=f"STAGE_{stage}")
             stage_grid = Gtk.Grid()
             stage_grid.set_column_spacing(8)
@@ -767,157 +1383,31 @@ class BlitzControl(Gtk.Box):
                 check = Gtk.CheckButton()
                 entry = Gtk.Entry()
                 entry.set_hexpand(True)
-                entry.connect("changed", self.on_gxi_entry_changed, check)
+                # Sensitivity follows the entry inside GLib; no Python hop per keystroke
+                entry.bind_property('text-length', check, 'sensitive', GObject.BindingFlags.SYNC_CREATE)
                 stage_grid.attach(check, 0, i, 1, 1)
                 stage_grid.attach(entry, 1, i, 1, 1)
                 self.stage_checks[stage].append(check)
                 self.stage_entries[stage].append(entry)
+                self.stage_widgets.append((stage, i, check, entry))
                 check.connect("toggled", self.on_stage_check_toggled, stage, i)
 
-        self.env_window = Gtk.Window(title="Environment Editor")
-        self.env_window.set_resizable(True)
-        self.env_window.connect("delete-event", lambda w, e: self.hide_and_save_editor(w, 'ENV') or True)
-        self.env_window.connect("configure-event", lambda w, e: self.save_editor_geometry(w, 'ENV_EDITOR') or False)
-        env_scrolled = Gtk.ScrolledWindow()
-        env_scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
-        env_grid = Gtk.Grid()
-        env_grid.set_column_spacing(12)
-        env_grid.set_row_spacing(8)
-        env_grid.set_border_width(10)
-        env_scrolled.add(env_grid)
-        self.env_window.add(env_scrolled)
-        self.system_env = load_env_multiline(SYSTEM_ENV)
-        self.imagine_env = load_env_multiline(IMAGINE_ENV)
-        self.user_env = load_env_multiline(USER_ENV)
-        self.all_keys = sorted(set(self.system_env.keys()) | set(self.imagine_env.keys()) | set(self.user_env.keys()))
         self.int_keys = {"STAGE_COUNT", "FIRE_COUNT", "TARGET_WIDTH", "TARGET_HEIGHT", "CAPTURE_MODE",
                          "MAX_OVERLAP_PERCENT", "FIRE_STACK_X_OFFSET", "FIRE_STACK_Y_OFFSET"}
         self.float_keys = {"STAGE_DELAY", "GRID_START_DELAY", "ROUND_DELAY", "INTER_TARGET_DELAY",
                            "SHOT_DELAY", "TARGET_OP_DELAY"}
         self.bool_keys = {"AUTO_FIRE", "DEDUPE_CAPTURES", "HARVEST_PROMPT_ON_STAGE", "SEND_PROMPT_ON_FIRE"}
-        headers = ["Key", ".system_env", ".imagine_env", ".user_env", "Merged (effective)"]
-        for col, header_text in enumerate(headers):
-            header = Gtk.Label(label=header_text)
-            header.get_style_context().add_class("heading")
-            header.set_xalign(0)
-            env_grid.attach(header, col, 0, 1, 1)
-        self.value_widgets = {key: {} for key in self.all_keys}
-        row = 1
-        for key in self.all_keys:
-            key_label = Gtk.Label(label=key)
-            key_label.set_xalign(0)
-            key_label.get_style_context().add_class("key-label")
-            env_grid.attach(key_label, 0, row, 1, 1)
-
-            if key == 'DEBUG_MASK':
-                categories = ['xdo', 'geom', 'init', 'gui', 'daemon', 'input', 'window', 'file']
-                cap_labels = ['XDO', 'GEOM', 'INIT', 'GUI', 'DAEMON', 'INPUT', 'WINDOW', 'FILE']
-
-                system_val = self.system_env.get(key, '')
-                system_widget = Gtk.TextView()
-                system_widget.get_buffer().set_text(system_val)
-                system_widget.set_editable(False)
-                system_frame = Gtk.Frame()
-                system_frame.add(system_widget)
-                env_grid.attach(system_frame, 1, row, 1, 1)
-                self.value_widgets[key]['system'] = system_widget
-
-                imagine_val = self.imagine_env.get(key, '')
-                imagine_widget = Gtk.TextView()
-                imagine_widget.get_buffer().set_text(imagine_val)
-                imagine_widget.set_editable(False)
-                imagine_frame = Gtk.Frame()
-                imagine_frame.add(imagine_widget)
-                env_grid.attach(imagine_frame, 2, row, 1, 1)
-                self.value_widgets[key]['imagine'] = imagine_widget
-
-                user_grid = Gtk.Grid()
-                user_grid.set_column_spacing(12)
-                user_grid.set_row_spacing(8)
-                user_grid.set_column_homogeneous(True)
-
-                user_val = self.user_env.get(key, '')
-                user_cats = [c.strip().lower() for c in user_val.split(',') if c.strip()]
-                if 'off' in user_cats:
-                    user_cats = []
-
-                for idx, (cap, lower) in enumerate(zip(cap_labels, categories)):
-                    check = Gtk.CheckButton(label=cap)
-                    check.set_active(lower in user_cats)
-                    check.connect("toggled", self.on_debug_check_toggled, key)
-                    row_idx = 0 if idx < 4 else 1
-                    col_idx = idx % 4
-                    user_grid.attach(check, col_idx, row_idx, 1, 1)
-                    self.debug_checks.append(check)
-
-                user_frame = Gtk.Frame()
-                user_frame.add(user_grid)
-                env_grid.attach(user_frame, 3, row, 1, 1)
-
-                hidden_user = Gtk.TextView()
-                hidden_user.get_buffer().set_text(user_val)
-                hidden_user.set_visible(False)
-                self.value_widgets[key]['user'] = hidden_user
-
-                merged_val = user_val or imagine_val or system_val
-                merged_widget = Gtk.TextView()
-                merged_widget.get_buffer().set_text(merged_val)
-                merged_widget.set_editable(False)
-                merged_frame = Gtk.Frame()
-                merged_frame.add(merged_widget)
-                env_grid.attach(merged_frame, 4, row, 1, 1)
-                self.value_widgets[key]['merged'] = merged_widget
-
-            else:
-                columns = [
-                    ("system", self.system_env.get(key, ''), True),
-                    ("imagine", self.imagine_env.get(key, ''), False),
-                    ("user", self.user_env.get(key, ''), False),
-                    ("merged", self.user_env.get(key) or self.imagine_env.get(key) or self.system_env.get(key, ''), False),
-                ]
-                for col_idx, (col_name, val, readonly) in enumerate(columns, start=1):
-                    widget = self.create_value_widget(key, val, readonly)
-                    frame = Gtk.Frame()
-                    frame.get_style_context().add_class(f"{col_name}-column")
-                    frame.set_border_width(4)
-                    frame.add(widget)
-                    env_grid.attach(frame, col_idx, row, 1, 1)
-                    self.value_widgets[key][col_name] = widget
-
-            row += 1
+        self.env_window = None
 
-        override_check = Gtk.CheckButton(label="Enable editing .system_env values (auto saves overrides to .user_env on change)")
-        override_check.connect("toggled", self.on_system_override_toggled)
-        env_grid.attach(override_check, 0, row, 5, 1)
-        row += 1
-        save_btn = Gtk.Button(label="Save Changes")
-        save_btn.connect("clicked", self.save_env_panel)
-        env_grid.attach(save_btn, 0, row, 5, 1)
-
-        self.env_window.hide()
         self.gxi_window.hide()
         self.gallery_window.hide()
 
-        self.env_saved_width = safe_int(read_merged_key('ENV_EDITOR_WIDTH'))
-        self.env_saved_height = safe_int(read_merged_key('ENV_EDITOR_HEIGHT'))
-        self.env_saved_x_off = safe_int(read_merged_key('ENV_EDITOR_X_OFFSET'))
-        self.env_saved_y_off = safe_int(read_merged_key('ENV_EDITOR_Y_OFFSET'))
-        self.gxi_saved_width = safe_int(read_merged_key('GXI_EDITOR_WIDTH'))
-        self.gxi_saved_height = safe_int(read_merged_key('GXI_EDITOR_HEIGHT'))
-        self.gxi_saved_x_off = safe_int(read_merged_key('GXI_EDITOR_X_OFFSET'))
-        self.gxi_saved_y_off = safe_int(read_merged_key('GXI_EDITOR_Y_OFFSET'))
-        self.gallery_saved_width = safe_int(read_merged_key('GALLERY_EDITOR_WIDTH') or 1200)
-        self.gallery_saved_height = safe_int(read_merged_key('GALLERY_EDITOR_HEIGHT') or 800)
-        self.gallery_saved_x_off = safe_int(read_merged_key('GALLERY_EDITOR_X_OFFSET') or 100)
-        self.gallery_saved_y_off = safe_int(read_merged_key('GALLERY_EDITOR_Y_OFFSET') or 100)
-        self.gxi_paned_position = safe_int(read_merged_key('GXI_PANED_POSITION') or 500)
-
         self.restore_all_geoms()
 
-        if startup_source:
-            self.handle_startup_source(startup_source)
+        if startup_kind:
+            self.handle_startup_source(startup_kind, startup_value, startup_urls)
 
-        GLib.idle_add(self.load_all_gxi)
+        GLib.idle_add(self.load_startup_gxi)
 
         self.capture_click_positions = []
 
@@ -925,11 +1415,11 @@ class BlitzControl(Gtk.Box):
 
         default = get_merged_multiline('DEFAULT_PROMPT').strip()
         buffer = self.live_prompt_view.get_buffer()
-        buffer.set_text(default)
+        set_buffer_text(buffer, default)
 
     def ensure_wb_copies(self):
         for url in list(self.batch_urls):
-            safe = urllib.parse.quote(url, safe='')
+            safe = _quote_url(url)
             wb_path = os.path.join(self.workbench_dir, safe + '.gxi')
             target_path = os.path.join(self.target_dir, safe + '.gxi')
             wb_png = os.path.join(self.workbench_dir, safe + '.png')
@@ -979,37 +1469,46 @@ class BlitzControl(Gtk.Box):
         box.pack_start(scrolled, True, True, 0)
         return box, textview
 
-    def create_value_widget(self, key, val, readonly):
-        if key in self.int_keys:
-            init_val = safe_int(val)
-            adj = Gtk.Adjustment(value=init_val, lower=0, upper=999999, step_increment=1)
-            widget = Gtk.SpinButton(adjustment=adj, climb_rate=0.0, digits=0)
-        elif key in self.float_keys:
-            init_val = safe_float(val)
-            adj = Gtk.Adjustment(value=init_val, lower=0.0, upper=999.0, step_increment=0.1)
-            widget = Gtk.SpinButton(adjustment=adj, climb_rate=0.0, digits=2)
-        elif key in self.bool_keys:
-            widget = Gtk.CheckButton()
-            active = str(val).lower() in ('1', 'y', 'true', 'yes', 'on')
-            widget.set_active(active)
-        else:
-            widget = Gtk.TextView()
-            widget.set_wrap_mode(Gtk.WrapMode.WORD)
-            buffer = widget.get_buffer()
-            buffer.set_text(val or '')
-        if isinstance(widget, (Gtk.SpinButton, Gtk.CheckButton)):
-            widget.set_sensitive(not readonly)
-        else:
-            widget.set_editable(not readonly)
+    def _build_int_widget(self, val, readonly):
+        adj = Gtk.Adjustment(value=safe_int(val), lower=0, upper=999999, step_increment=1)
+        widget = Gtk.SpinButton(adjustment=adj, climb_rate=0.0, digits=0)
+        widget.set_sensitive(not readonly)
+        self._int_spin_widgets.add(widget)
+        return widget
+
+    def _build_float_widget(self, val, readonly):
+        adj = Gtk.Adjustment(value=safe_float(val), lower=0.0, upper=999.0, step_increment=0.1)
+        widget = Gtk.SpinButton(adjustment=adj, climb_rate=0.0, digits=2)
+        widget.set_sensitive(not readonly)
+        return widget
+
+    def _build_bool_widget(self, val, readonly):
+        widget = Gtk.CheckButton()
+        widget.set_active(is_truthy(str(val)))
+        widget.set_sensitive(not readonly)
+        return widget
+
+    def _build_readonly_label(self, val):
+        # Read-only cells only display text; a label skips the TextView buffer and editor machinery
+        label = Gtk.Label(label=val or '')
+        label.set_xalign(0)
+        label.set_line_wrap(True)
+        label.set_line_wrap_mode(Pango.WrapMode.WORD_CHAR)
+        return label
+
+    def _build_text_widget(self, val, readonly):
+        widget = Gtk.TextView()
+        widget.set_wrap_mode(Gtk.WrapMode.WORD)
+        set_buffer_text(widget.get_buffer(), val or '')
+        widget.set_editable(not readonly)
         return widget
 
     def on_debug_check_toggled(self, widget, key):
         categories = ['xdo', 'geom', 'init', 'gui', 'daemon', 'input', 'window', 'file']
         checked = [categories[i] for i, c in enumerate(self.debug_checks) if c.get_active()]
         new_val = ','.join(checked) if checked else 'off'
-        buffer = self.value_widgets[key]['user'].get_buffer()
-        buffer.set_text(new_val)
-        self.recompute_merged(key)
+        self.set_widget_value(self._user_widgets[self._key_index[key]], new_val)
+        self.schedule_recompute_merged(key)
 
     def on_filter_clicked(self, widget):
         self.filter_mode = (self.filter_mode + 1) % 3
@@ -1035,21 +1534,13 @@ class BlitzControl(Gtk.Box):
         if not active_urls:
             log_debug(CAT_GUI, "Push skipped - no checked active GXIs")
             return
-        for url in active_urls:
-            path = self.wb_gxi_paths.get(url)
-            if not path:
-                log_debug(CAT_GUI, f"Push skipped for {url} - no workbench path found")
-                continue
-            header_lines, prompts, histories, comment = parse_gxi(path)
+        def edit(header_lines, prompts, histories, comment):
             for stage in prompts:
                 for i in range(len(prompts[stage])):
                     prompts[stage][i] = prompts[stage][i].lstrip('@')
             prompts['1'].insert(0, '@' + push_text)
-            prompts = dedupe_prompts(prompts)
-            write_gxi(path, header_lines, prompts, histories, comment)
-            log_debug(CAT_GUI, f"Push wrote to workbench GXI for URL {url} - OK")
-        if self.current_url in active_urls:
-            self.load_current_gxi()
+            return header_lines, dedupe_prompts(prompts), histories, comment
+        self.push_to_gxis(active_urls, edit, "Push")
 
     def on_push_comment(self, widget):
         if self.busy: return
@@ -1067,15 +1558,47 @@ class BlitzControl(Gtk.Box):
         log_debug(CAT_GUI, f"Push Comment to {len(active_urls)} checked active GXIs: {active_urls}")
         if not active_urls:
             return
+        self.push_to_gxis(active_urls,
+                          lambda header_lines, prompts, histories, _: (header_lines, prompts, histories, new_comment),
+                          "Push Comment")
+
+    def push_to_gxis(self, active_urls, edit, label):
+        # Read-modify-write runs on the IO worker; the editor reloads once when the batch is done
+        self.wait_for_push()
+        paths = []
         for url in active_urls:
             path = self.wb_gxi_paths.get(url)
             if not path:
+                log_debug(CAT_GUI, f"{label} skipped for {url} - no workbench path found")
                 continue
-            header_lines, prompts, histories, _ = parse_gxi(path)
-            write_gxi(path, header_lines, prompts, histories, new_comment)
-            log_debug(CAT_GUI, f"Push Comment wrote to workbench GXI for URL {url} - OK")
+            paths.append((url, path))
+        self._push_future = self._io_pool.submit(self._push_worker, paths, edit, label)
+        self._push_future.add_done_callback(
+            lambda f: GLib.idle_add(self._push_done, active_urls, f))
+
+    def _push_worker(self, paths, edit, label):
+        for url, path in paths:
+            write_gxi(path, *edit(*parse_gxi_cached(path)))
+            self._prompt_map_dirty = True
+            log_debug(CAT_GUI, f"{label} wrote to workbench GXI for URL {url} - OK")
+
+    def _push_done(self, active_urls, future):
+        if future is self._push_future:
+            self._push_future = None
+        try:
+            future.result()
+        except Exception as e:
+            log_debug(CAT_FILE, f"GXI push failed: {e}")
         if self.current_url in active_urls:
             self.load_current_gxi()
+        return False
+
+    def wait_for_push(self):
+        if self._push_future:
+            try:
+                self._push_future.result()
+            except Exception:
+                pass
 
     def on_push_account(self, widget):
         if self.busy: return
@@ -1086,26 +1609,189 @@ class BlitzControl(Gtk.Box):
         log_debug(CAT_GUI, f"Push Acct '{acct}' to {len(active_urls)} checked active GXIs: {active_urls}")
         if not active_urls:
             return
-        for url in active_urls:
-            path = self.wb_gxi_paths.get(url)
-            if not path:
-                continue
-            header_lines, prompts, histories, comment = parse_gxi(path)
+        def edit(header_lines, prompts, histories, comment):
             new_header = [line for line in header_lines if not line.strip().startswith('ACCOUNT=')]
             new_header.append(f"ACCOUNT={acct}\n")
-            write_gxi(path, new_header, prompts, histories, comment)
-            log_debug(CAT_GUI, f"Push Acct wrote to workbench GXI for URL {url} - OK")
-        if self.current_url in active_urls:
-            self.load_current_gxi()
+            return new_header, prompts, histories, comment
+        self.push_to_gxis(active_urls, edit, "Push Acct")
+
+    def _build_env_window(self):
+        # Built on first open; most sessions never show the ENV editor
+        if self.env_window is not None:
+            return
+        self.env_window = Gtk.Window(title="Environment Editor")
+        self.env_window.set_resizable(True)
+        self.env_window.connect("delete-event", lambda w, e: self.hide_and_save_editor(w, 'ENV') or True)
+        self.env_window.connect("configure-event", lambda w, e: self.schedule_geom_save('ENV_EDITOR', w))
+        env_scrolled = Gtk.ScrolledWindow()
+        env_scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
+        env_grid = Gtk.Grid()
+        env_grid.set_column_spacing(12)
+        env_grid.set_row_spacing(8)
+        env_grid.set_border_width(10)
+        env_scrolled.add(env_grid)
+        self.env_window.add(env_scrolled)
+        self.system_env = load_env_cached(SYSTEM_ENV)
+        self.imagine_env = load_env_cached(IMAGINE_ENV)
+        self.user_env = load_env_cached(USER_ENV)
+        self.all_keys = sorted(set(self.system_env.keys()) | set(self.imagine_env.keys()) | set(self.user_env.keys()))
+        headers = ["Key", ".system_env", ".imagine_env", ".user_env", "Merged (effective)"]
+        for col, header_text in enumerate(headers):
+            header = Gtk.Label(label=header_text)
+            header.get_style_context().add_class("heading")
+            header.set_xalign(0)
+            env_grid.attach(header, col, 0, 1, 1)
+        # Parallel per-column lists indexed through _key_index
+        self._key_index = {key: i for i, key in enumerate(self.all_keys)}
+        self._int_spin_widgets = set()
+        # Widget type is fixed per key, so pick each key's constructor once instead of per cell
+        self._builder_by_key = dict.fromkeys(self.all_keys, self._build_text_widget)
+        for typed_keys, builder in ((self.bool_keys, self._build_bool_widget),
+                                    (self.float_keys, self._build_float_widget),
+                                    (self.int_keys, self._build_int_widget)):
+            self._builder_by_key.update(dict.fromkeys(typed_keys & self._key_index.keys(), builder))
+        self._sys_widgets = [None] * len(self.all_keys)
+        self._imagine_widgets = [None] * len(self.all_keys)
+        self._user_widgets = [None] * len(self.all_keys)
+        self._merged_widgets = [None] * len(self.all_keys)
+        self._column_widgets = {'system': self._sys_widgets, 'imagine': self._imagine_widgets,
+                                'user': self._user_widgets, 'merged': self._merged_widgets}
+        self.env_grid = env_grid
+        self._env_rows_built = 0
+        self._build_env_rows(ENV_ROWS_FIRST)
+        if self._env_rows_built < len(self.all_keys):
+            GLib.idle_add(self._build_env_rows_idle)
+        row = len(self.all_keys) + 1
+
+        override_check = Gtk.CheckButton(label="Enable editing .system_env values (auto saves overrides to .user_env on change)")
+        override_check.connect("toggled", self.on_system_override_toggled)
+        env_grid.attach(override_check, 0, row, 5, 1)
+        row += 1
+        save_btn = Gtk.Button(label="Save Changes")
+        save_btn.connect("clicked", self.save_env_panel)
+        env_grid.attach(save_btn, 0, row, 5, 1)
+
+    def _build_env_rows(self, count):
+        # Rows are materialized top-down: the first screenful on open, the rest from idle
+        keys = self.all_keys
+        build_row = self._build_env_row
+        end = min(len(keys), self._env_rows_built + count)
+        for i in range(self._env_rows_built, end):
+            build_row(i, keys[i])
+        self._env_rows_built = end
+        if self.env_window.get_visible():
+            self.env_grid.show_all()
+
+    def _build_env_rows_idle(self):
+        if self.env_window is None:
+            return False
+        self._build_env_rows(ENV_ROWS_PER_IDLE)
+        return self._env_rows_built < len(self.all_keys)
+
+    def _build_env_row(self, i, key):
+        row = i + 1
+        key_label = Gtk.Label(label=key)
+        key_label.set_xalign(0)
+        key_label.get_style_context().add_class("key-label")
+        self.env_grid.attach(key_label, 0, row, 1, 1)
+
+        if key == 'DEBUG_MASK':
+            categories = ['xdo', 'geom', 'init', 'gui', 'daemon', 'input', 'window', 'file']
+            cap_labels = ['XDO', 'GEOM', 'INIT', 'GUI', 'DAEMON', 'INPUT', 'WINDOW', 'FILE']
+
+            system_val = self.system_env.get(key, '')
+            if self.system_override_enabled:
+                system_widget = self._builder_by_key[key](system_val, False)
+            else:
+                system_widget = self._build_readonly_label(system_val)
+            self.style_env_cell(system_widget, 'system')
+            self.env_grid.attach(system_widget, 1, row, 1, 1)
+            self._sys_widgets[i] = system_widget
+
+            imagine_val = self.imagine_env.get(key, '')
+            imagine_widget = self._build_readonly_label(imagine_val)
+            self.style_env_cell(imagine_widget, 'imagine')
+            self.env_grid.attach(imagine_widget, 2, row, 1, 1)
+            self._imagine_widgets[i] = imagine_widget
+
+            user_grid = Gtk.Grid()
+            user_grid.set_column_spacing(12)
+            user_grid.set_row_spacing(8)
+            user_grid.set_column_homogeneous(True)
+
+            user_val = self.user_env.get(key, '')
+            user_cats = [c.strip().lower() for c in user_val.split(',') if c.strip()]
+            if 'off' in user_cats:
+                user_cats = []
+
+            for idx, (cap, lower) in enumerate(zip(cap_labels, categories)):
+                check = Gtk.CheckButton(label=cap)
+                check.set_active(lower in user_cats)
+                check.connect("toggled", self.on_debug_check_toggled, key)
+                row_idx = 0 if idx < 4 else 1
+                col_idx = idx % 4
+                user_grid.attach(check, col_idx, row_idx, 1, 1)
+                self.debug_checks.append(check)
+
+            self.style_env_cell(user_grid, 'user')
+            self.env_grid.attach(user_grid, 3, row, 1, 1)
+
+            hidden_user = Gtk.Label(label=user_val)
+            self._user_widgets[i] = hidden_user
+
+            merged_val = user_val or imagine_val or system_val
+            merged_widget = self._build_readonly_label(merged_val)
+            self.style_env_cell(merged_widget, 'merged')
+            self.env_grid.attach(merged_widget, 4, row, 1, 1)
+            self._merged_widgets[i] = merged_widget
+
+        else:
+            columns = [
+                ("system", self.system_env.get(key, ''), not self.system_override_enabled),
+                ("imagine", self.imagine_env.get(key, ''), False),
+                ("user", self.user_env.get(key, ''), False),
+                ("merged", self.user_env.get(key) or self.imagine_env.get(key) or self.system_env.get(key, ''), False),
+            ]
+            build = self._builder_by_key[key]
+            build_label = self._build_readonly_label
+            style = self.style_env_cell
+            attach = self.env_grid.attach
+            column_widgets = self._column_widgets
+            for col_idx, (col_name, val, readonly) in enumerate(columns, start=1):
+                widget = build_label(val) if readonly else build(val, readonly)
+                style(widget, col_name)
+                attach(widget, col_idx, row, 1, 1)
+                column_widgets[col_name][i] = widget
+
+    def style_env_cell(self, widget, col_name):
+        # Cells sit directly in the grid at a fixed width, so GtkGrid has no extra container level to measure
+        widget.get_style_context().add_class(f"{col_name}-column")
+        widget.set_margin_start(4)
+        widget.set_margin_end(4)
+        widget.set_margin_top(4)
+        widget.set_margin_bottom(4)
+        widget.set_hexpand(False)
+        widget.set_size_request(ENV_COL_WIDTH, -1)
+
+    def env_cell_value(self, i, col):
+        widget = self._column_widgets[col][i]
+        if widget is not None:
+            return self.get_widget_value(widget)
+        key = self.all_keys[i]
+        if col == 'merged':
+            return self.user_env.get(key) or self.imagine_env.get(key) or self.system_env.get(key, '')
+        env = {'system': self.system_env, 'imagine': self.imagine_env, 'user': self.user_env}[col]
+        return env.get(key, '')
 
     def toggle_env_panel(self, widget):
         if self.busy: return
-        if self.env_window.get_visible():
+        if self.env_window and self.env_window.get_visible():
             self.save_editor_geometry(self.env_window, 'ENV_EDITOR')
             self.save_env_panel()
             self.env_window.hide()
             self.env_toggle.set_label("ENV Editor ▲")
         else:
+            self._build_env_window()
             self.apply_editor_geometry(self.env_window, self.env_saved_width, self.env_saved_height, self.env_saved_x_off, self.env_saved_y_off)
             self.env_window.show_all()
             self.env_toggle.set_label("ENV Editor ▼")
@@ -1116,7 +1802,7 @@ class BlitzControl(Gtk.Box):
             self.save_editor_geometry(self.gxi_window, 'GXI_EDITOR')
             pos = self.gxi_paned.get_position()
             update_env(USER_ENV, 'GXI_PANED_POSITION', str(pos))
-            log_debug(CAT_GEOM, f"GXI PANED SAVED on toggle hide position={pos}")
+            log_debug(CAT_GEOM, lambda: f"GXI PANED SAVED on toggle hide position={pos}")
             self.gxi_window.hide()
             self.gallery_window.hide()
             self.gxi_toggle.set_label("GXI Manager ▲")
@@ -1124,7 +1810,7 @@ class BlitzControl(Gtk.Box):
             self.apply_editor_geometry(self.gxi_window, self.gxi_saved_width, self.gxi_saved_height, self.gxi_saved_x_off, self.gxi_saved_y_off)
             if self.gxi_paned_position > 0:
                 self.gxi_paned.set_position(self.gxi_paned_position)
-                log_debug(CAT_GEOM, f"GXI PANED RESTORED position={self.gxi_paned_position}")
+                log_debug(CAT_GEOM, lambda: f"GXI PANED RESTORED position={self.gxi_paned_position}")
             self.gxi_window.show_all()
             self.apply_editor_geometry(self.gallery_window, self.gallery_saved_width, self.gallery_saved_height, self.gallery_saved_x_off, self.gallery_saved_y_off)
             self.gallery_window.show_all()
@@ -1140,7 +1826,7 @@ class BlitzControl(Gtk.Box):
             self.save_editor_geometry(self.gxi_window, 'GXI_EDITOR')
             pos = self.gxi_paned.get_position()
             update_env(USER_ENV, 'GXI_PANED_POSITION', str(pos))
-            log_debug(CAT_GEOM, f"GXI PANED SAVED on delete-event position={pos}")
+            log_debug(CAT_GEOM, lambda: f"GXI PANED SAVED on delete-event position={pos}")
             self.gallery_window.hide()
         elif prefix == 'GALLERY':
             self.save_editor_geometry(self.gallery_window, 'GALLERY_EDITOR')
@@ -1149,26 +1835,46 @@ class BlitzControl(Gtk.Box):
         window.hide()
         return True
 
+    def schedule_geom_save(self, prefix, window=None):
+        source = self._pending_save_source.pop(prefix, None)
+        if source:
+            GLib.source_remove(source)
+        self._pending_save_source[prefix] = GLib.timeout_add(200, self._flush_geom_save, prefix, window)
+        return False
+
+    def _flush_geom_save(self, prefix, window):
+        self._pending_save_source.pop(prefix, None)
+        if window is None:
+            self.save_all_geoms()
+        else:
+            self.save_editor_geometry(window, prefix)
+        return False
+
     def save_editor_geometry(self, window, prefix):
+        update_env_many(USER_ENV, self.editor_geometry_updates(window, prefix))
+
+    def editor_geometry_updates(self, window, prefix):
         try:
             width, height = window.get_size()
             x, y = window.get_position()
-            log_debug(CAT_GEOM, f"{prefix.upper()} BEFORE SAVE: size={width}x{height}, pos=({x},{y})")
-            monitor = Gdk.Display.get_default().get_primary_monitor()
-            geom = monitor.get_geometry()
+            log_debug(CAT_GEOM, lambda: f"{prefix.upper()} BEFORE SAVE: size={width}x{height}, pos=({x},{y})")
+            geom = self._get_monitor_geom()
             x_off = x
             y_off = geom.height - y - height
-            update_env(USER_ENV, f'{prefix}_WIDTH', str(width))
-            update_env(USER_ENV, f'{prefix}_HEIGHT', str(height))
-            update_env(USER_ENV, f'{prefix}_X_OFFSET', str(x_off))
-            update_env(USER_ENV, f'{prefix}_Y_OFFSET', str(y_off))
-            log_debug(CAT_GEOM, f"{prefix.upper()} SAVED: width={width}, height={height}, x_off={x_off}, y_off={y_off}")
+            log_debug(CAT_GEOM, lambda: f"{prefix.upper()} SAVED: width={width}, height={height}, x_off={x_off}, y_off={y_off}")
+            return {
+                f'{prefix}_WIDTH': str(width),
+                f'{prefix}_HEIGHT': str(height),
+                f'{prefix}_X_OFFSET': str(x_off),
+                f'{prefix}_Y_OFFSET': str(y_off),
+            }
         except Exception as e:
             log_debug(CAT_GUI, f"Editor geometry save error ({prefix}): {e}")
+            return {}
 
     def apply_editor_geometry(self, window, width, height, x_off, y_off):
         title = window.get_title()
-        log_debug(CAT_GEOM, f"{title.upper()} REQUESTED: width={width}, height={height}, x_off={x_off}, y_off={y_off}")
+        log_debug(CAT_GEOM, lambda: f"{title.upper()} REQUESTED: width={width}, height={height}, x_off={x_off}, y_off={y_off}")
         if width <= 0:
             width = 1400 if 'GXI' in title else 1000
         if height <= 0:
@@ -1177,84 +1883,112 @@ class BlitzControl(Gtk.Box):
         window.resize(width, height)
         if x_off >= 0 and y_off >= 0:
             try:
-                monitor = Gdk.Display.get_default().get_primary_monitor()
-                geom = monitor.get_geometry()
+                geom = self._get_monitor_geom()
                 calculated_y = geom.height - height - y_off if height > 0 else geom.height - y_off
                 window.move(x_off, calculated_y)
             except Exception as e:
                 log_debug(CAT_GUI, f"Editor geometry apply error: {e}")
+        if not log_enabled(CAT_GEOM):
+            return
         actual_w, actual_h = window.get_size()
         actual_x, actual_y = window.get_position()
-        log_debug(CAT_GEOM, f"{title.upper()} ACTUAL AFTER APPLY: size={actual_w}x{actual_h}, pos=({actual_x},{actual_y})")
+        log_debug(CAT_GEOM, lambda: f"{title.upper()} ACTUAL AFTER APPLY: size={actual_w}x{actual_h}, pos=({actual_x},{actual_y})")
 
     def restore_all_geoms(self):
-        width = safe_int(read_merged_key('PANEL_DEFAULT_WIDTH'))
-        height = safe_int(read_merged_key('PANEL_DEFAULT_HEIGHT'))
+        self._merged_env, self._key_source = merged_env()
+        width = read_merged_int('PANEL_DEFAULT_WIDTH')
+        height = read_merged_int('PANEL_DEFAULT_HEIGHT')
         if width > 0 and height > 0:
-            log_debug(CAT_GEOM, f"MAIN PANEL REQUESTED size={width}x{height}")
+            log_debug(CAT_GEOM, lambda: f"MAIN PANEL REQUESTED size={width}x{height}")
             self.parent_app.set_default_size(width, height)
 
-        self.env_saved_width = safe_int(read_merged_key('ENV_EDITOR_WIDTH'))
-        self.env_saved_height = safe_int(read_merged_key('ENV_EDITOR_HEIGHT'))
-        self.env_saved_x_off = safe_int(read_merged_key('ENV_EDITOR_X_OFFSET'))
-        self.env_saved_y_off = safe_int(read_merged_key('ENV_EDITOR_Y_OFFSET'))
-        self.gxi_saved_width = safe_int(read_merged_key('GXI_EDITOR_WIDTH'))
-        self.gxi_saved_height = safe_int(read_merged_key('GXI_EDITOR_HEIGHT'))
-        self.gxi_saved_x_off = safe_int(read_merged_key('GXI_EDITOR_X_OFFSET'))
-        self.gxi_saved_y_off = safe_int(read_merged_key('GXI_EDITOR_Y_OFFSET'))
-        self.gallery_saved_width = safe_int(read_merged_key('GALLERY_EDITOR_WIDTH') or 1200)
-        self.gallery_saved_height = safe_int(read_merged_key('GALLERY_EDITOR_HEIGHT') or 800)
-        self.gallery_saved_x_off = safe_int(read_merged_key('GALLERY_EDITOR_X_OFFSET') or 100)
-        self.gallery_saved_y_off = safe_int(read_merged_key('GALLERY_EDITOR_Y_OFFSET') or 100)
-        self.gxi_paned_position = safe_int(read_merged_key('GXI_PANED_POSITION') or 500)
+        env = self._merged_env
+        for attr, key, default in EDITOR_GEOM_KEYS:
+            setattr(self, attr, safe_int(env.get(key) or default))
 
     def save_all_geoms(self):
+        # Panel, editors and paned position go out as one user-env rewrite per debounced flush
+        updates = {}
         w, h = self.parent_app.get_size()
         x, y = self.parent_app.get_position()
-        log_debug(CAT_GEOM, f"MAIN PANEL BEFORE SAVE: size={w}x{h}, pos=({x},{y})")
+        log_debug(CAT_GEOM, lambda: f"MAIN PANEL BEFORE SAVE: size={w}x{h}, pos=({x},{y})")
         try:
-            monitor = Gdk.Display.get_default().get_primary_monitor()
-            geom = monitor.get_geometry()
+            geom = self._get_monitor_geom()
             y_off = geom.height - y - h
-            update_env(USER_ENV, 'PANEL_DEFAULT_WIDTH', str(w))
-            update_env(USER_ENV, 'PANEL_DEFAULT_HEIGHT', str(h))
-            update_env(USER_ENV, 'PANEL_DEFAULT_X_OFFSET', str(x))
-            update_env(USER_ENV, 'PANEL_DEFAULT_Y_OFFSET', str(y_off))
-            log_debug(CAT_GEOM, f"MAIN PANEL SAVED: width={w}, height={h}, x_off={x}, y_off={y_off}")
+            updates.update({
+                'PANEL_DEFAULT_WIDTH': str(w),
+                'PANEL_DEFAULT_HEIGHT': str(h),
+                'PANEL_DEFAULT_X_OFFSET': str(x),
+                'PANEL_DEFAULT_Y_OFFSET': str(y_off),
+            })
+            app = self.parent_app
+            app.saved_width, app.saved_height, app.saved_x_off, app.saved_y_off = w, h, x, y_off
+            log_debug(CAT_GEOM, lambda: f"MAIN PANEL SAVED: width={w}, height={h}, x_off={x}, y_off={y_off}")
         except Exception as e:
             log_debug(CAT_GUI, f"Main panel geometry save error: {e}")
 
-        if self.env_window.get_visible():
-            self.save_editor_geometry(self.env_window, 'ENV_EDITOR')
+        if self.env_window and self.env_window.get_visible():
+            updates.update(self.editor_geometry_updates(self.env_window, 'ENV_EDITOR'))
         if self.gxi_window.get_visible():
-            self.save_editor_geometry(self.gxi_window, 'GXI_EDITOR')
+            updates.update(self.editor_geometry_updates(self.gxi_window, 'GXI_EDITOR'))
             pos = self.gxi_paned.get_position()
-            update_env(USER_ENV, 'GXI_PANED_POSITION', str(pos))
-            log_debug(CAT_GEOM, f"GXI PANED SAVED position={pos}")
+            updates['GXI_PANED_POSITION'] = str(pos)
+            log_debug(CAT_GEOM, lambda: f"GXI PANED SAVED position={pos}")
         if self.gallery_window.get_visible():
-            self.save_editor_geometry(self.gallery_window, 'GALLERY_EDITOR')
+            updates.update(self.editor_geometry_updates(self.gallery_window, 'GALLERY_EDITOR'))
+        update_env_many(USER_ENV, updates)
 
     def on_system_override_toggled(self, check):
         self.system_override_enabled = check.get_active()
-        for key in self.all_keys:
-            widget = self.value_widgets[key]['system']
-            if widget:
-                if isinstance(widget, Gtk.TextView):
-                    widget.set_editable(self.system_override_enabled)
-                else:
-                    widget.set_sensitive(self.system_override_enabled)
+        for i, widget in enumerate(self._sys_widgets):
+            if widget is None:
+                continue
+            if isinstance(widget, Gtk.Label):
+                if not self.system_override_enabled:
+                    continue
+                editor = self._builder_by_key[self.all_keys[i]](widget.get_text(), False)
+                self.style_env_cell(editor, 'system')
+                self.env_grid.remove(widget)
+                self.env_grid.attach(editor, 1, i + 1, 1, 1)
+                editor.show_all()
+                self._sys_widgets[i] = editor
+            elif isinstance(widget, Gtk.TextView):
+                widget.set_editable(self.system_override_enabled)
+            else:
+                widget.set_sensitive(self.system_override_enabled)
+
+    def schedule_recompute_merged(self, key):
+        # A burst of edits to one key collapses into a single merge once it goes quiet
+        source = self._pending_merge.pop(key, None)
+        if source:
+            GLib.source_remove(source)
+        self._pending_merge[key] = GLib.timeout_add(80, self._do_recompute_merged, key)
+
+    def _do_recompute_merged(self, key):
+        self._pending_merge.pop(key, None)
+        self.recompute_merged(key)
+        return False
+
+    def flush_pending_merges(self):
+        for key, source in list(self._pending_merge.items()):
+            GLib.source_remove(source)
+            self._do_recompute_merged(key)
 
     def recompute_merged(self, key):
         self.updating_merged = True
-        user_val = self.get_widget_value(self.value_widgets[key]['user'])
-        imagine_val = self.get_widget_value(self.value_widgets[key]['imagine'])
-        system_val = self.get_widget_value(self.value_widgets[key]['system'])
-        merged_val = user_val or imagine_val or system_val or ''
-        widget = self.value_widgets[key]['merged']
-        self.set_widget_value(widget, merged_val)
+        i = self._key_index[key]
+        # Highest-priority non-empty column wins; lower columns are only read when needed
+        merged_val = ''
+        for widgets in (self._user_widgets, self._imagine_widgets, self._sys_widgets):
+            merged_val = self.get_widget_value(widgets[i])
+            if merged_val:
+                break
+        self.set_widget_value(self._merged_widgets[i], merged_val)
         self.updating_merged = False
 
     def get_widget_value(self, widget):
+        if widget in self._int_spin_widgets:
+            return str(widget.get_value_as_int())
         if isinstance(widget, Gtk.SpinButton):
             val = widget.get_value()
             return str(int(val)) if val.is_integer() else str(val)
@@ -1264,6 +1998,8 @@ class BlitzControl(Gtk.Box):
             buffer = widget.get_buffer()
             start, end = buffer.get_bounds()
             return buffer.get_text(start, end, False)
+        elif isinstance(widget, Gtk.Label):
+            return widget.get_text()
         return ''
 
     def set_widget_value(self, widget, value):
@@ -1273,36 +2009,34 @@ class BlitzControl(Gtk.Box):
             except:
                 pass
         elif isinstance(widget, Gtk.CheckButton):
-            widget.set_active(value.lower() in ('1', 'y', 'true', 'yes', 'on'))
+            widget.set_active(is_truthy(value))
         elif isinstance(widget, Gtk.TextView):
             buffer = widget.get_buffer()
-            buffer.set_text(value)
+            set_buffer_text(buffer, value)
+        elif isinstance(widget, Gtk.Label):
+            widget.set_text(value)
 
     def save_env_panel(self, widget=None):
         if self.busy: return
-        changed = False
-        for key in self.all_keys:
+        self.flush_pending_merges()
+        changes = {}
+        for i, key in enumerate(self.all_keys):
             if key == 'DEFAULT_PROMPT':
                 continue
-            merged_widget = self.value_widgets[key]['merged']
-            value = self.get_widget_value(merged_widget)
+            value = self.env_cell_value(i, 'merged')
             if key in self.int_keys:
                 try:
                     value = str(int(float(value)))
                 except:
                     pass
             system_val = self.system_env.get(key, '')
-            if value != system_val:
-                update_env(USER_ENV, key, value)
-                changed = True
+            changes[key] = value if value != system_val else None
 
-        if 'DEFAULT_PROMPT' in self.all_keys:
-            user_widget = self.value_widgets['DEFAULT_PROMPT']['user']
-            prompt_val = self.get_widget_value(user_widget)
-            update_env(USER_ENV, 'DEFAULT_PROMPT', prompt_val)
-            changed = True
+        if 'DEFAULT_PROMPT' in self._key_index:
+            changes['DEFAULT_PROMPT'] = self.env_cell_value(self._key_index['DEFAULT_PROMPT'], 'user')
 
-        if changed:
+        if changes:
+            update_env_many(USER_ENV, changes)
             prune_env(USER_ENV)
 
     def save_active_gun(self, widget):
@@ -1332,7 +2066,7 @@ class BlitzControl(Gtk.Box):
 
     def archive_gxi(self, widget, url):
         if self.busy: return
-        source_path = os.path.join(self.target_dir, urllib.parse.quote(url, safe='') + '.gxi')
+        source_path = os.path.join(self.target_dir, _quote_url(url) + '.gxi')
         if not os.path.exists(source_path):
             log_debug(CAT_FILE, f"Archive skipped - no path for {url}")
             return
@@ -1356,15 +2090,44 @@ class BlitzControl(Gtk.Box):
     def on_carousel_row_clicked(self, widget, url):
         if self.busy: return
         self.current_url = url
-        self.load_current_gxi()
-        for child in self.carousel_box.get_children():
-            child.get_style_context().remove_class("selected")
+        self.request_load_current_gxi()
+        if self._selected_carousel_row is not None:
+            self._selected_carousel_row.get_style_context().remove_class("selected")
         widget.get_style_context().add_class("selected")
+        self._selected_carousel_row = widget
 
     def on_gallery_row_clicked(self, widget, url):
         if self.busy: return
         self.current_url = url
-        self.load_current_gxi()
+        self.request_load_current_gxi()
+
+    def request_load_current_gxi(self):
+        # Rapid clicks collapse into one load; only the last selected URL is parsed
+        if self._gxi_load_source:
+            GLib.source_remove(self._gxi_load_source)
+        self._gxi_load_source = GLib.timeout_add(120, self._do_gxi_load)
+
+    def _do_gxi_load(self):
+        self._gxi_load_source = None
+        url = self.current_url
+        if not url:
+            self.load_current_gxi()
+            return False
+        wb_path = os.path.join(self.workbench_dir, _quote_url(url) + '.gxi')
+        future = self._io_pool.submit(parse_gxi_cached, wb_path)
+        future.add_done_callback(lambda f, u=url: GLib.idle_add(self._apply_gxi_load, u, f))
+        return False
+
+    def _apply_gxi_load(self, url, future):
+        if url != self.current_url:
+            return False
+        try:
+            parsed = future.result()
+        except Exception as e:
+            log_debug(CAT_FILE, f"Async GXI parse failed for {url}: {e}")
+            parsed = None
+        self.load_current_gxi(parsed)
+        return False
 
     def on_new_target(self, widget):
         if self.busy: return
@@ -1385,19 +2148,14 @@ class BlitzControl(Gtk.Box):
                 self.load_current_gxi()
         dialog.destroy()
 
-    def on_gxi_entry_changed(self, entry, check):
-        text = entry.get_text().strip()
-        check.set_sensitive(bool(text))
-
     def on_stage_check_toggled(self, check, stage, index):
         if not check.get_sensitive():
             check.set_active(False)
             return
         if check.get_active():
-            for s in ['1', '2', '3', 'U']:
-                for j in range(5):
-                    if s != stage or j != index:
-                        self.stage_checks[s][j].set_active(False)
+            for _, _, other, _ in self.stage_widgets:
+                if other is not check and other.get_active():
+                    other.set_active(False)
             prompt = self.stage_entries[stage][index].get_text().strip()
             self.update_live_prompt_label(prompt or "")
             if self.current_url and self.current_url in self.batch_urls:
@@ -1406,14 +2164,14 @@ class BlitzControl(Gtk.Box):
 
     def update_live_prompt_label(self, prompt_text):
         buffer = self.live_prompt_view.get_buffer()
-        buffer.set_text(prompt_text)
+        set_buffer_text(buffer, prompt_text)
         log_debug(CAT_GUI, f"Live Prompt box populated from STAGE check toggle: '{prompt_text}'")
 
     def get_active_prompt_for_url(self, url):
-        wb_path = os.path.join(self.workbench_dir, urllib.parse.quote(url, safe='') + '.gxi')
+        wb_path = os.path.join(self.workbench_dir, _quote_url(url) + '.gxi')
         if os.path.exists(wb_path):
-            _, prompts, _, _ = parse_gxi(wb_path)
-            for stage in ['1', '2', '3', 'U']:
+            _, prompts, _, _ = parse_gxi_cached(wb_path)
+            for stage in _GXI_FIRE_ORDER:
                 stage_prompts = prompts.get(stage, [])
                 for p in stage_prompts:
                     if p.startswith('@'):
@@ -1435,7 +2193,7 @@ class BlitzControl(Gtk.Box):
             if prompt:
                 source = "DEFAULT_PROMPT fallback"
         buffer = self.live_prompt_view.get_buffer()
-        buffer.set_text(prompt or "")
+        set_buffer_text(buffer, prompt or "")
         log_debug(CAT_GUI, f"Live Prompt box populated from {source}: '{prompt or ''}'")
 
     def on_editor_active_toggled(self, check):
@@ -1454,7 +2212,33 @@ class BlitzControl(Gtk.Box):
         self.fire_btn.set_label("STOP" if self.firing else "FIRE")
         self.update_status("Ready" if not self.firing else "Firing...")
 
-    def load_current_gxi(self):
+    def fill_stage_rows(self, prompts):
+        # One layout pass for all 20 rows; unchanged widgets are left alone so they emit nothing
+        gdk_window = self.gxi_window.get_window()
+        if gdk_window:
+            gdk_window.freeze_updates()
+        self.stages_box.freeze_child_notify()
+        try:
+            for stage, i, check, entry in self.stage_widgets:
+                stage_prompts = prompts.get(stage, [])
+                if i < len(stage_prompts):
+                    p = stage_prompts[i]
+                    prompt_text = p.lstrip('@')
+                    if entry.get_text() != prompt_text:
+                        entry.set_text(prompt_text)
+                    if p.startswith('@') and not check.get_active():
+                        check.set_active(True)
+                else:
+                    if entry.get_text():
+                        entry.set_text('')
+                    if check.get_active():
+                        check.set_active(False)
+        finally:
+            self.stages_box.thaw_child_notify()
+            if gdk_window:
+                gdk_window.thaw_updates()
+
+    def load_current_gxi(self, parsed=None):
         if self.busy: return
         self.current_gxi_path = None
         self.current_histories = {}
@@ -1462,8 +2246,8 @@ class BlitzControl(Gtk.Box):
         self.thumb_image.hide()
 
         if not self.current_url:
-            self.live_comment_view.get_buffer().set_text("")
-            self.comment_view.get_buffer().set_text("")
+            set_buffer_text(self.live_comment_view.get_buffer(), "")
+            set_buffer_text(self.comment_view.get_buffer(), "")
             self.acct_entry.set_text("")
             self.editor_active_check.set_active(False)
             self.update_live_prompt_from_selection()
@@ -1472,19 +2256,21 @@ class BlitzControl(Gtk.Box):
         self.url_label.set_text(self.get_display_url(self.current_url))
         self.url_label.set_tooltip_text(self.current_url)
 
-        safe_name = urllib.parse.quote(self.current_url, safe='') + '.gxi'
+        safe_name = _quote_url(self.current_url) + '.gxi'
         wb_path = os.path.join(self.workbench_dir, safe_name)
         self.current_gxi_path = wb_path
         if not os.path.exists(wb_path):
             log_debug(CAT_FILE, f"LOAD_CURRENT_GXI: File not found in workbench for '{self.current_url}' - path {wb_path}")
-            self.live_comment_view.get_buffer().set_text("")
-            self.comment_view.get_buffer().set_text("")
+            set_buffer_text(self.live_comment_view.get_buffer(), "")
+            set_buffer_text(self.comment_view.get_buffer(), "")
             self.acct_entry.set_text("")
             self.editor_active_check.set_active(False)
             self.update_live_prompt_from_selection()
             return
 
-        header_lines, prompts, histories, comment = parse_gxi(self.current_gxi_path)
+        if parsed is None:
+            parsed = parse_gxi_cached(self.current_gxi_path)
+        header_lines, prompts, histories, comment = parsed
 
         born_on = "Never"
         account = ""
@@ -1497,41 +2283,30 @@ class BlitzControl(Gtk.Box):
 
         self.born_label.set_text(f"Born On: {born_on}")
         self.acct_entry.set_text(account)
-        self.comment_view.get_buffer().set_text(comment)
-        self.live_comment_view.get_buffer().set_text(comment)
+        set_buffer_text(self.comment_view.get_buffer(), comment)
+        set_buffer_text(self.live_comment_view.get_buffer(), comment)
         self.editor_active_check.set_active(self.current_url in self.gun_active_urls)
 
         self.current_histories = histories
 
-        active_prompt = None
-        for stage in ['1', '2', '3', 'U']:
-            stage_prompts = prompts.get(stage, [])
-            for i in range(5):
-                entry = self.stage_entries[stage][i]
-                check = self.stage_checks[stage][i]
-                if i < len(stage_prompts):
-                    p = stage_prompts[i]
-                    is_active = p.startswith('@')
-                    prompt_text = p.lstrip('@')
-                    entry.set_text(prompt_text)
-                    check.set_sensitive(bool(prompt_text))
-                    if is_active:
-                        check.set_active(True)
-                        active_prompt = prompt_text
-                else:
-                    entry.set_text('')
-                    check.set_sensitive(False)
-                    check.set_active(False)
+        self.fill_stage_rows(prompts)
 
-        thumb_path = os.path.join(self.workbench_dir, urllib.parse.quote(self.current_url, safe='') + '.png')
-        if os.path.exists(thumb_path):
-            try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(thumb_path, 256, 256, True)
+        thumb_name = _quote_url(self.current_url) + '.png'
+        thumb_path = os.path.join(self.workbench_dir, thumb_name)
+        if thumb_name in dir_entries(self.workbench_dir):
+            url = self.current_url
+
+            def on_ready(pixbuf):
+                if url != self.current_url:
+                    return
                 self.thumb_image.set_from_pixbuf(pixbuf)
                 self.thumb_image.show()
                 log_debug(CAT_FILE, "LOAD_CURRENT_GXI: Loaded real thumbnail for right pane")
-            except Exception as e:
+
+            def on_error(e):
                 log_debug(CAT_FILE, f"LOAD_CURRENT_GXI: Right pane thumbnail load failed - hidden: {e}")
+
+            self.load_thumb(thumb_path, 256, on_ready, on_error)
         else:
             log_debug(CAT_FILE, "LOAD_CURRENT_GXI: No thumbnail - using placeholder")
             placeholder = GdkPixbuf.Pixbuf.new(GdkPixbuf.Colorspace.RGB, True, 8, 256, 256)
@@ -1560,7 +2335,10 @@ class BlitzControl(Gtk.Box):
 
         acct = self.acct_entry.get_text().strip()
 
-        header_lines, prompts, histories, _ = parse_gxi(self.current_gxi_path)
+        self.wait_for_push()
+        header_lines, prompts, histories, old_comment = parse_gxi_cached(self.current_gxi_path)
+        old_prompts = {stage: list(p) for stage, p in prompts.items()}
+        old_acct = next((line.strip()[8:].strip() for line in header_lines if line.strip().startswith('ACCOUNT=')), None)
         new_header = []
         for line in header_lines:
             if line.strip().startswith(('BORN_ON=', 'ACCOUNT=', 'TARGET_DESC=')):
@@ -1570,7 +2348,7 @@ class BlitzControl(Gtk.Box):
         new_header.append(f"ACCOUNT={acct}\n")
         new_header.append(f"TARGET_DESC={comment}\n")
 
-        for stage in ['U', '1', '2', '3']:
+        for stage in _GXI_STAGE_ORDER:
             for i in range(5):
                 prompt = self.stage_entries[stage][i].get_text().strip()
                 is_active = self.stage_checks[stage][i].get_active()
@@ -1582,7 +2360,11 @@ class BlitzControl(Gtk.Box):
 
         prompts = dedupe_prompts(prompts)
         apply_overflow(prompts)
-        write_gxi(self.current_gxi_path, new_header, prompts, histories, comment)
+        if prompts == old_prompts and acct == old_acct and comment == old_comment:
+            log_debug(CAT_FILE, f"SAVE_CURRENT_GXI: no changes for {self.current_url} - write skipped")
+        else:
+            write_gxi(self.current_gxi_path, new_header, prompts, histories, comment)
+            self._prompt_map_dirty = True
         self.update_live_prompt_from_selection()
 
     def on_stage(self, widget):
@@ -1590,11 +2372,12 @@ class BlitzControl(Gtk.Box):
         self.busy = True
         self.stage_btn.set_sensitive(False)
         self.save_current_gxi()
-        if self.env_window.get_visible():
+        if self.env_window and self.env_window.get_visible():
             self.save_env_panel()
         self.update_status("Staging windows...")
-        stage_delay = safe_float(read_merged_key('STAGE_DELAY') or 2.0)
-        grid_start_delay = safe_float(read_merged_key('GRID_START_DELAY') or 5)
+        env = merged_env()[0]
+        stage_delay = safe_float(env.get('STAGE_DELAY') or 2.0)
+        grid_start_delay = safe_float(env.get('GRID_START_DELAY') or 5)
         self.gentle_target_op('kill')
         self.current_wids = []
         self.capture_click_positions = []
@@ -1611,7 +2394,7 @@ class BlitzControl(Gtk.Box):
         head_flags = load_flags('BROWSER_FLAGS_HEAD')
         middle_flags = load_flags('BROWSER_FLAGS_MIDDLE')
         tail_prefix = get_merged_multiline('BROWSER_FLAGS_TAIL')
-        browser = read_merged_key('BROWSER') or 'chromium'
+        browser = env.get('BROWSER') or 'chromium'
         cmd_base = [browser] + head_flags + middle_flags
         for i in range(num):
             url = urls[i % len(urls)]
@@ -1622,38 +2405,45 @@ class BlitzControl(Gtk.Box):
             subprocess.Popen(cmd, stderr=subprocess.DEVNULL)
             time.sleep(stage_delay)
         GLib.timeout_add(int(grid_start_delay * 1000), lambda: self.grid_windows(num) or False)
-        if read_merged_key('AUTO_FIRE') in ('1', 'Y', 'true', 'True'):
-            GLib.timeout_add(int((grid_start_delay + 5) * 1000), self.on_fire)
+        # Gridding no longer blocks the main loop, so auto-fire waits for it to finish instead of a fixed timer
+        self._auto_fire_pending = env.get('AUTO_FIRE') in ('1', 'Y', 'true', 'True')
         self.busy = False
         self.stage_btn.set_sensitive(True)
 
     def gentle_target_op(self, op_type, sync=True, delay=None, capture=True):
-        delay = safe_float(read_merged_key('TARGET_OP_DELAY') or 0.25)
+        env = merged_env()[0]
+        delay = safe_float(env.get('TARGET_OP_DELAY') or 0.25)
 
         if op_type == 'kill':
+            # The X server queues the close requests itself, so the batched path needs no delay between windows
+            if x_close_windows(self.current_wids):
+                log_debug(CAT_XDO, lambda: f"XLIB: _NET_CLOSE_WINDOW sent to {len(self.current_wids)} windows")
+                self.current_wids = []
+                self.update_fire_state()
+                return
             for wid_str in self.current_wids[:]:
                 try:
                     wid_int = int(wid_str)
                     wid_hex = f"0x{wid_int:08x}"
-                    log_debug(CAT_XDO, f"XDO: wmctrl -i -c {wid_hex} (close wid {wid_str})")
+                    log_debug(CAT_XDO, lambda: f"XDO: wmctrl -i -c {wid_hex} (close wid {wid_str})")
                     res = subprocess.run(['wmctrl', '-i', '-c', wid_hex], check=False, capture_output=True, text=True)
-                    log_debug(CAT_XDO, f"XDO: wmctrl close returncode {res.returncode}" + (f", stderr: {res.stderr.strip()}" if res.returncode != 0 else ""))
+                    log_debug(CAT_XDO, lambda: f"XDO: wmctrl close returncode {res.returncode}" + (f", stderr: {res.stderr.strip()}" if res.returncode != 0 else ""))
                     time.sleep(delay)
                 except Exception as e:
-                    log_debug(CAT_XDO, f"XDO: error closing wid {wid_str}: {e}")
+                    log_debug(CAT_XDO, lambda: f"XDO: error closing wid {wid_str}: {e}")
             self.current_wids = []
             self.update_fire_state()
             return
 
         if op_type == 'activate' and self.current_wids:
-            capture_mode = safe_int(read_merged_key('CAPTURE_MODE') or '0')
+            capture_mode = safe_int(env.get('CAPTURE_MODE') or '0')
             do_capture = capture and capture_mode != 0
-            harvest_enabled = read_merged_key('HARVEST_PROMPT_ON_STAGE') in ('1', 'Y', 'true', 'True', 'yes', 'on') if do_capture else False
+            harvest_enabled = env.get('HARVEST_PROMPT_ON_STAGE') in ('1', 'Y', 'true', 'True', 'yes', 'on') if do_capture else False
 
             processed_urls = set() if do_capture else None
 
             for idx, wid_str in enumerate(self.current_wids, start=1):
-                log_debug(CAT_XDO, f"XDO: windowactivate {'--sync' if sync else ''} {wid_str}")
+                log_debug(CAT_XDO, lambda: f"XDO: windowactivate {'--sync' if sync else ''} {wid_str}")
                 subprocess.run(['xdotool', 'windowactivate', '--sync' if sync else '', wid_str], capture_output=True, text=True)
                 time.sleep(delay)
 
@@ -1663,7 +2453,7 @@ class BlitzControl(Gtk.Box):
                         time.sleep(delay)
                         continue
 
-                    safe_name = urllib.parse.quote(cycle_url, safe='')
+                    safe_name = _quote_url(cycle_url)
                     capture_path = os.path.join(self.workbench_dir, f"{safe_name}.png")
 
                     if idx - 1 < len(self.capture_click_positions):
@@ -1671,22 +2461,22 @@ class BlitzControl(Gtk.Box):
 
                         try:
                             mouse_loc = subprocess.check_output(['xdotool', 'getmouselocation'], text=True).strip()
-                            log_debug(CAT_XDO, f"XDO: mouse before ops on wid {wid_str}: {mouse_loc}")
+                            log_debug(CAT_XDO, lambda: f"XDO: mouse before ops on wid {wid_str}: {mouse_loc}")
                         except Exception as e:
-                            log_debug(CAT_XDO, f"XDO: getmouselocation pre failed: {e}")
+                            log_debug(CAT_XDO, lambda: f"XDO: getmouselocation pre failed: {e}")
 
-                        log_debug(CAT_XDO, f"XDO: mousemove {click_x} {click_y}, click 1 on wid {wid_str}")
+                        log_debug(CAT_XDO, lambda: f"XDO: mousemove {click_x} {click_y}, click 1 on wid {wid_str}")
                         subprocess.run(['xdotool', 'mousemove', str(click_x), str(click_y),
                                         'click', '1'], capture_output=True, text=True)
                         time.sleep(delay)
 
-                        log_debug(CAT_XDO, f"XDO: key ctrl+a on {wid_str}")
+                        log_debug(CAT_XDO, lambda: f"XDO: key ctrl+a on {wid_str}")
                         subprocess.run(['xdotool', 'key', '--window', wid_str, '--clearmodifiers', 'ctrl+a'],
                                        capture_output=True, text=True)
                         time.sleep(0.1)
 
                         if harvest_enabled:
-                            log_debug(CAT_XDO, f"XDO: key ctrl+c on {wid_str} (harvest)")
+                            log_debug(CAT_XDO, lambda: f"XDO: key ctrl+c on {wid_str} (harvest)")
                             subprocess.run(['xdotool', 'key', '--window', wid_str, '--clearmodifiers', 'ctrl+c'],
                                            capture_output=True, text=True)
                             time.sleep(delay)
@@ -1694,37 +2484,38 @@ class BlitzControl(Gtk.Box):
                             prompt = get_clipboard()
                             path = self.wb_gxi_paths.get(cycle_url)
                             if prompt and path:
-                                header_lines, prompts, histories, _ = parse_gxi(path)
+                                header_lines, prompts, histories, _ = parse_gxi_cached(path)
                                 prompts['U'].insert(0, prompt)
                                 apply_overflow(prompts)
                                 write_gxi(path, header_lines, prompts, histories, "")
 
                         needs_delete = True
                         if needs_delete:
-                            log_debug(CAT_XDO, f"XDO: key Delete on {wid_str}")
+                            log_debug(CAT_XDO, lambda: f"XDO: key Delete on {wid_str}")
                             res = subprocess.run(['xdotool', 'key', '--window', wid_str, '--clearmodifiers', 'Delete'],
                                                  capture_output=True, text=True)
-                            log_debug(CAT_XDO, f"XDO: Delete key returncode {res.returncode}" + (f", stderr: {res.stderr.strip()}" if res.returncode != 0 else ""))
+                            log_debug(CAT_XDO, lambda: f"XDO: Delete key returncode {res.returncode}" + (f", stderr: {res.stderr.strip()}" if res.returncode != 0 else ""))
                         time.sleep(delay)
 
-                        log_debug(CAT_XDO, f"XDO: capturing with maim on wid {wid_str} → {capture_path}")
+                        log_debug(CAT_XDO, lambda: f"XDO: capturing with maim on wid {wid_str} → {capture_path}")
                         cmd = ['maim', '--hidecursor', '-i', wid_str, capture_path]
                         result = subprocess.run(cmd, capture_output=True)
                         if result.returncode == 0:
-                            log_debug(CAT_XDO, f"XDO: capture success → {capture_path}")
+                            log_debug(CAT_XDO, lambda: f"XDO: capture success → {capture_path}")
                         else:
-                            log_debug(CAT_XDO, f"XDO: capture failed, returncode {result.returncode}, stderr: {result.stderr.decode().strip()}")
+                            log_debug(CAT_XDO, lambda: f"XDO: capture failed, returncode {result.returncode}, stderr: {result.stderr.decode().strip()}")
 
                     if processed_urls is not None:
                         processed_urls.add(cycle_url)
                 time.sleep(delay)
 
     def on_fire(self, widget=None):
+        env = merged_env()[0]
         if self.busy: return
         self.busy = True
         self.fire_btn.set_sensitive(False)
         self.save_current_gxi()
-        if self.env_window.get_visible():
+        if self.env_window and self.env_window.get_visible():
             self.save_env_panel()
         if not self.firing:
             if not self.current_wids:
@@ -1735,33 +2526,31 @@ class BlitzControl(Gtk.Box):
             update_env(IMAGINE_ENV, 'FIRE_MODE', 'Y')
             self.update_fire_state()
             self.update_status("Firing...")
-            sw, sh = 1920, 1080
-            log_debug(CAT_XDO, "XDO: getdisplaygeometry (stacking)")
-            try:
-                output = subprocess.check_output(['xdotool', 'getdisplaygeometry']).decode().strip()
-                sw, sh = map(int, output.split())
-                log_debug(CAT_XDO, f"XDO: getdisplaygeometry → {sw}x{sh}")
-            except Exception as e:
-                log_debug(CAT_XDO, f"XDO: getdisplaygeometry failed: {e}")
-            target_width = safe_int(read_merged_key('TARGET_WIDTH') or 640)
-            target_height = safe_int(read_merged_key('TARGET_HEIGHT') or 500)
+            sw, sh = self._get_display_geom()
+            target_width = safe_int(env.get('TARGET_WIDTH') or 640)
+            target_height = safe_int(env.get('TARGET_HEIGHT') or 500)
             center_x = (sw - target_width) // 2
             center_y = (sh - target_height) // 2
-            offset_x = safe_int(read_merged_key('FIRE_STACK_X_OFFSET') or 0)
-            offset_y = safe_int(read_merged_key('FIRE_STACK_Y_OFFSET') or 0)
+            offset_x = safe_int(env.get('FIRE_STACK_X_OFFSET') or 0)
+            offset_y = safe_int(env.get('FIRE_STACK_Y_OFFSET') or 0)
             stack_x = center_x + offset_x
             stack_y = center_y + offset_y
-            for wid in self.current_wids:
-                geom_res = subprocess.run(['xdotool', 'getwindowgeometry', '--shell', wid], capture_output=True, text=True)
-                if geom_res.returncode == 0:
-                    log_debug(CAT_XDO, f"XDO: pre-stack geometry wid {wid}:\n{geom_res.stdout.strip()}")
-                xdo_resize_move(wid, target_width, target_height, stack_x, stack_y)
-                geom_res = subprocess.run(['xdotool', 'getwindowgeometry', '--shell', wid], capture_output=True, text=True)
-                if geom_res.returncode == 0:
-                    log_debug(CAT_XDO, f"XDO: post-stack geometry wid {wid}:\n{geom_res.stdout.strip()}")
+            trace_geom = bool(GLOBAL_DEBUG_MASK & CAT_XDO)
+            if trace_geom:
+                for wid in self.current_wids:
+                    geom_res = subprocess.run(['xdotool', 'getwindowgeometry', '--shell', wid], capture_output=True, text=True)
+                    if geom_res.returncode == 0:
+                        log_debug(CAT_XDO, f"XDO: pre-stack geometry wid {wid}:\n{geom_res.stdout.strip()}")
+                    xdo_resize_move(wid, target_width, target_height, stack_x, stack_y)
+                    geom_res = subprocess.run(['xdotool', 'getwindowgeometry', '--shell', wid], capture_output=True, text=True)
+                    if geom_res.returncode == 0:
+                        log_debug(CAT_XDO, f"XDO: post-stack geometry wid {wid}:\n{geom_res.stdout.strip()}")
+            else:
+                xdo_resize_move_many([(wid, target_width, target_height, stack_x, stack_y) for wid in self.current_wids], sync=False)
+            x_sync()
 
-            relative_x = percent_to_pixels(read_merged_key('PROMPT_X_FROM_LEFT') or '50%', target_width)
-            relative_y = target_height - percent_to_pixels(read_merged_key('PROMPT_Y_FROM_BOTTOM') or '10%', target_height)
+            relative_x = percent_to_pixels(env.get('PROMPT_X_FROM_LEFT') or '50%', target_width)
+            relative_y = target_height - percent_to_pixels(env.get('PROMPT_Y_FROM_BOTTOM') or '10%', target_height)
             prompt_x = stack_x + relative_x
             prompt_y = stack_y + relative_y
 
@@ -1776,11 +2565,12 @@ class BlitzControl(Gtk.Box):
         self.fire_btn.set_sensitive(True)
 
     def daemon_thread_func(self, prompt_x, prompt_y, relative_x, relative_y):
+        env = merged_env()[0]
         total_shots = 0
         fire_count = self.fire_spin.get_value_as_int()
-        round_delay = safe_float(read_merged_key('ROUND_DELAY') or 10)
-        inter_target_delay = safe_float(read_merged_key('INTER_TARGET_DELAY') or 0.5)
-        shot_delay = safe_float(read_merged_key('SHOT_DELAY') or 0.5)
+        round_delay = safe_float(env.get('ROUND_DELAY') or 10)
+        inter_target_delay = safe_float(env.get('INTER_TARGET_DELAY') or 0.5)
+        shot_delay = safe_float(env.get('SHOT_DELAY') or 0.5)
 
         wid = self.current_wids[0]
         log_debug(CAT_XDO, f"XDO: mousemove --window {wid} {relative_x} {relative_y} (single pre-loop move to prompt in stack)")
@@ -1798,18 +2588,24 @@ class BlitzControl(Gtk.Box):
             GLib.idle_add(self.update_fire_state)
             return
 
+        # Prompts are loop-invariant across shots; re-read between rounds only after an editor save or push
+        prompt_map = {}
+        fired_lines = {}
         for round_num in range(1, fire_count + 1):
             if round_num > 1:
                 time.sleep(round_delay)
             if not self.current_wids or not self.firing:
                 break
+            if self._prompt_map_dirty or not prompt_map:
+                self._prompt_map_dirty = False
+                prompt_map = {u: self.get_active_prompt_for_url(u) for u in gun_urls}
 
             for idx, wid in enumerate(self.current_wids, start=1):
                 if not self.firing:
                     break
 
                 cycle_url = gun_urls[(idx - 1) % len(gun_urls)]
-                prompt = self.get_active_prompt_for_url(cycle_url)
+                prompt = prompt_map.get(cycle_url)
 
                 if prompt is None:
                     log_debug(CAT_DAEMON, f"Skipping {cycle_url} - no prompt available")
@@ -1818,22 +2614,21 @@ class BlitzControl(Gtk.Box):
                 orig_clip = get_clipboard()
 
                 if prompt.strip() == self.PROMPT_ERASE_CHAR:
-                    gentle_target_op('key', '--window', str(wid), 'Control+a Delete')
                     clipboard_set("")
-                    gentle_target_op('key', '--window', str(wid), 'Return')
+                    xdo_key(wid, ERASE_KEYS)
 
                 elif prompt.strip() == self.PROMPT_SILENT_CHAR:
                     clipboard_set("")
-                    gentle_target_op('key', '--window', str(wid), 'Return')
+                    xdo_key(wid, ('Return',))
 
                 else:
                     clipboard_set(prompt)
                     if self.PROMPT_FIRE_CHAIN:
-                        gentle_target_op('key', '--window', str(wid), '--delay', '5', 'Control+a Delete Control+v Return')
+                        xdo_key(wid, FIRE_KEYS, delay=5)
                     else:
-                        gentle_target_op('key', '--window', str(wid), 'Control+a Delete')
-                        gentle_target_op('key', '--window', str(wid), 'Control+v')
-                        gentle_target_op('key', '--window', str(wid), 'Return')
+                        xdo_key(wid, FIRE_KEYS[:2])
+                        xdo_key(wid, FIRE_KEYS[2:3])
+                        xdo_key(wid, FIRE_KEYS[3:])
 
                 clipboard_set(orig_clip)
 
@@ -1843,12 +2638,18 @@ class BlitzControl(Gtk.Box):
                 update_status(f"Firing round {round_num}/{fire_count} — {total_shots} shots")
 
                 path = self.wb_gxi_paths.get(cycle_url)
-                if path and os.path.exists(path):
+                if path:
+                    fired_lines.setdefault(path, []).append(f"{prompt}\n")
+
+            # One append per GXI per round instead of an open/close per shot
+            for path, lines in fired_lines.items():
+                if os.path.exists(path):
                     try:
                         with open(path, 'a', encoding='utf-8') as f:
-                            f.write(f"{prompt}\n")
+                            f.writelines(lines)
                     except:
                         pass
+            fired_lines.clear()
 
         update_status(f"Done — {total_shots} shots")
         self.firing = False
@@ -1858,17 +2659,26 @@ class BlitzControl(Gtk.Box):
         GLib.timeout_add(5000, lambda: self.update_status("Ready") or False)
 
     def on_quit(self, widget):
+        if self._gxi_load_source:
+            GLib.source_remove(self._gxi_load_source)
+            self._gxi_load_source = None
+        for source in self._pending_save_source.values():
+            GLib.source_remove(source)
+        self._pending_save_source.clear()
+        self._io_pool.shutdown(wait=False)
+        self._thumb_pool.shutdown(wait=False, cancel_futures=True)
         self.save_current_gxi()
 
-        update_env(USER_ENV, 'FIRE_COUNT', str(self.fire_spin.get_value_as_int()))
-        update_env(USER_ENV, 'STAGE_COUNT', str(self.stage_spin.get_value_as_int()))
-
         buffer = self.live_prompt_view.get_buffer()
         start, end = buffer.get_bounds()
         prompt_text = buffer.get_text(start, end, False)
-        update_env(USER_ENV, 'DEFAULT_PROMPT', prompt_text)
+        update_env_many(USER_ENV, {
+            'FIRE_COUNT': str(self.fire_spin.get_value_as_int()),
+            'STAGE_COUNT': str(self.stage_spin.get_value_as_int()),
+            'DEFAULT_PROMPT': prompt_text,
+        })
 
-        if self.env_window.get_visible():
+        if self.env_window and self.env_window.get_visible():
             self.save_env_panel()
 
         self.save_all_geoms()
@@ -1887,98 +2697,174 @@ class BlitzControl(Gtk.Box):
         except Exception as e:
             log_debug(CAT_FILE, f"Clean quit copy error: {e}")
 
-        prune_env(USER_ENV)
-        prune_env(IMAGINE_ENV, runtime_keys=RUNTIME_KEYS)
+        system_values = load_env_cached(SYSTEM_ENV)
+        prune_env(USER_ENV, system_values=system_values)
+        prune_env(IMAGINE_ENV, runtime_keys=RUNTIME_KEYS, system_values=system_values)
         self.gentle_target_op('kill')
+        flush_env_files()
         Gtk.main_quit()
 
-    def load_all_gxi(self):
-        if self.busy: return
-        self.busy = True
-        log_debug(CAT_FILE, "LOAD_ALL_GXI: Starting rebuild")
+    def scan_gxi_urls(self):
+        # DirEntry already carries the joined path, so nothing is rebuilt per file
+        self.gxi_paths = {}
         try:
-            files = os.listdir(self.target_dir)
+            with os.scandir(self.target_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if name[-4:].lower() == '.gxi':
+                        self.gxi_paths[urllib.parse.unquote(name[:-4])] = entry.path
         except Exception as e:
-            log_debug(CAT_FILE, f"LOAD_ALL_GXI: os.listdir FAILED: {e}")
-            files = []
-        self.all_urls = []
-        self.gxi_paths = {}
-        for file in files:
-            if file.lower().endswith('.gxi'):
-                decoded_url = urllib.parse.unquote(file[:-4])
-                self.all_urls.append(decoded_url)
-                self.gxi_paths[decoded_url] = os.path.join(self.target_dir, file)
-        self.all_urls.sort(key=str.lower)
+            log_debug(CAT_FILE, f"LOAD_ALL_GXI: os.scandir FAILED: {e}")
+        self.all_urls = sorted(self.gxi_paths, key=str.lower)
 
         self.batch_urls = {u for u in self.batch_urls if u in self.gxi_paths}
         self.gun_active_urls = {u for u in self.gun_active_urls if u in self.gxi_paths}
-        log_debug(CAT_GUI, f"Auto-pruned ghosts - batch:{len(self.batch_urls)} gun:{len(self.gun_active_urls)}")
+        log_debug(CAT_GUI, lambda: f"Auto-pruned ghosts - batch:{len(self.batch_urls)} gun:{len(self.gun_active_urls)}")
+
+    def load_startup_gxi(self):
+        # Startup only needs the URL lists; gallery and carousel rows wait until the GXI Manager is shown
+        if self.busy or self._gxi_loaded_once:
+            return False
+        self.scan_gxi_urls()
+        self.load_current_gxi()
+        self.save_active_gun(None)
+        self.save_gun_active()
+        return False
+
+    def load_all_gxi(self):
+        if self.busy: return
+        self.busy = True
+        log_debug(CAT_FILE, "LOAD_ALL_GXI: Starting rebuild")
+        self.scan_gxi_urls()
+        # Only the full rebuild reads every GXI; startup loads just the one it shows
+        prefetch_files(self.gxi_paths.values())
 
         for child in self.gallery_flowbox.get_children():
             self.gallery_flowbox.remove(child)
-        for child in self.carousel_box.get_children():
-            self.carousel_box.remove(child)
+            self.gallery_pool.append(child)
 
         self.gallery_checks.clear()
-        self.carousel_gun_checks.clear()
-        self.row_widgets.clear()
 
-        for url in self.all_urls:
-            if self.filter_mode == 1 and url not in self.batch_urls:
-                continue
-            if self.filter_mode == 2 and url in self.batch_urls:
-                continue
+        self.gallery_flowbox.hide()
+        self.gallery_flowbox.freeze_child_notify()
+        try:
+            for url in self.all_urls:
+                if self.filter_mode == 1 and url not in self.batch_urls:
+                    continue
+                if self.filter_mode == 2 and url in self.batch_urls:
+                    continue
 
-            gallery_row = self.create_thumb_row(url, True)
-            flow_child = Gtk.FlowBoxChild()
-            flow_child.add(gallery_row)
-            self.gallery_flowbox.add(flow_child)
+                if self.gallery_pool:
+                    flow_child = self.gallery_pool.pop()
+                    self.bind_thumb_row(flow_child.get_child(), url)
+                else:
+                    flow_child = Gtk.FlowBoxChild()
+                    flow_child.add(self.create_thumb_row(url, True))
+                self.gallery_flowbox.add(flow_child)
+        finally:
+            self.gallery_flowbox.thaw_child_notify()
+        for flow_child in self.gallery_pool:
+            flow_child.destroy()
+        self.gallery_pool.clear()
 
-        self.load_carousel()
+        self._rebuild_carousel()
 
         self.gallery_flowbox.show_all()
-        self.carousel_box.show_all()
         self.load_current_gxi()
 
         self.save_active_gun(None)
         self.save_gun_active()
+        self._gxi_loaded_once = True
         self.busy = False
 
     def load_carousel(self):
         if self.busy: return
+        self._rebuild_carousel()
+
+    def _rebuild_carousel(self):
+        # Old rows go back to a pool and are rebound to the new URLs instead of being rebuilt
+        if self._selected_carousel_row is not None:
+            self._selected_carousel_row.get_style_context().remove_class("selected")
+        self._selected_carousel_row = None
         for child in self.carousel_box.get_children():
+            row = child.get_child()
+            if row is not None:
+                child.remove(row)
+                self.carousel_pool.append(row)
             self.carousel_box.remove(child)
         self.carousel_gun_checks.clear()
         self.row_widgets.clear()
 
         try:
-            wb_files = os.listdir(self.workbench_dir)
+            with os.scandir(self.workbench_dir) as it:
+                wb_files = [entry.name for entry in it if entry.name[-4:].lower() == '.gxi']
         except Exception as e:
-            log_debug(CAT_FILE, f"load_carousel os.listdir workbench failed: {e}")
+            log_debug(CAT_FILE, f"load_carousel os.scandir workbench failed: {e}")
             wb_files = []
-        for file in wb_files:
-            if file.lower().endswith('.gxi'):
+        # Hidden while filling so each add skips measure/allocate; one layout pass on show
+        self.carousel_box.hide()
+        self.carousel_box.freeze_child_notify()
+        try:
+            for file in wb_files:
                 decoded_url = urllib.parse.unquote(file[:-4])
                 if decoded_url in self.batch_urls:
-                    carousel_row = self.create_thumb_row(decoded_url, False)
+                    if self.carousel_pool:
+                        carousel_row = self.carousel_pool.pop()
+                        self.bind_thumb_row(carousel_row, decoded_url)
+                    else:
+                        carousel_row = self.create_thumb_row(decoded_url, False)
                     self.carousel_box.add(carousel_row)
+        finally:
+            self.carousel_box.thaw_child_notify()
+        for row in self.carousel_pool:
+            row.destroy()
+        self.carousel_pool.clear()
 
         # === FORCE CAROUSEL REDRAW (this fixes your exact bug) ===
-        for child in self.carousel_box.get_children():
-            child.show_all()
         self.carousel_box.show_all()
         self.carousel_box.queue_resize()
         self.carousel_box.queue_draw()
         self.carousel_scrolled.queue_draw()
 
-        log_debug(CAT_GUI, f"load_carousel: added {len(self.carousel_box.get_children())} items to carousel")
+        log_debug(CAT_GUI, lambda: f"load_carousel: added {len(self.carousel_box.get_children())} items to carousel")
 
         if not self.batch_urls:
             self.current_url = None
             self.load_current_gxi()
 
+    def load_thumb(self, path, size, on_ready, on_error):
+        # Decoded thumbnails are reused until the PNG changes; least recently used are dropped first.
+        # Cache misses decode on the thumb pool and land through an idle callback, so rebuilds never wait on PNGs.
+        try:
+            key = (path, os.stat(path).st_mtime_ns, size)
+        except OSError as e:
+            on_error(e)
+            return
+        pixbuf = self._thumb_cache.get(key)
+        if pixbuf is not None:
+            self._thumb_cache.move_to_end(key)
+            on_ready(pixbuf)
+            return
+        future = self._thumb_pool.submit(GdkPixbuf.Pixbuf.new_from_file_at_scale, path, size, size, True)
+        future.add_done_callback(lambda f: GLib.idle_add(self._thumb_decoded, key, f, on_ready, on_error))
+
+    def _thumb_decoded(self, key, future, on_ready, on_error):
+        if future.cancelled():
+            return False
+        try:
+            pixbuf = future.result()
+        except Exception as e:
+            on_error(e)
+            return False
+        self._thumb_cache[key] = pixbuf
+        if len(self._thumb_cache) > THUMB_CACHE_SIZE:
+            self._thumb_cache.popitem(last=False)
+        on_ready(pixbuf)
+        return False
+
     def create_thumb_row(self, url, is_gallery):
         eventbox = Gtk.EventBox()
+        eventbox.is_gallery = is_gallery
         row_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         row_box.set_margin_start(10)
         row_box.set_margin_end(10)
@@ -1989,64 +2875,36 @@ class BlitzControl(Gtk.Box):
         thumb_btn = Gtk.Button()
         thumb_btn.set_size_request(thumb_size, thumb_size)
         thumb_btn.set_relief(Gtk.ReliefStyle.NORMAL)
+        thumb_img = Gtk.Image()
+        thumb_btn.add(thumb_img)
 
         if is_gallery:
-            thumb_path = os.path.join(self.target_dir, urllib.parse.quote(url, safe='') + '.png')
-        else:
-            thumb_path = os.path.join(self.workbench_dir, urllib.parse.quote(url, safe='') + '.png')
-        if os.path.exists(thumb_path):
-            try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(thumb_path, thumb_size, thumb_size, True)
-                img = Gtk.Image.new_from_pixbuf(pixbuf)
-                thumb_btn.add(img)
-            except Exception as e:
-                log_debug(CAT_FILE, f"Thumbnail load failed: {e}")
-                thumb_btn.get_style_context().add_class("missing-thumb")
+            thumb_btn.connect("clicked", lambda w, e=eventbox: self.on_gallery_row_clicked(w, e.url))
         else:
-            thumb_btn.get_style_context().add_class("missing-thumb")
-
-        if is_gallery:
-            thumb_btn.connect("clicked", lambda w, u=url: self.on_gallery_row_clicked(w, u))
-        else:
-            thumb_btn.connect("clicked", lambda w, u=url: self.on_carousel_row_clicked(w, u))
+            thumb_btn.connect("clicked", lambda w, e=eventbox: self.on_carousel_row_clicked(w, e.url))
 
         row_box.pack_start(thumb_btn, False, False, 0)
 
-        url_label = Gtk.Label(label=self.get_display_url(url))
+        url_label = Gtk.Label()
         url_label.set_xalign(0)
         url_label.set_ellipsize(Pango.EllipsizeMode.END)
         url_label.set_max_width_chars(35)
-        url_label.set_tooltip_text(url)
         url_label.get_style_context().add_class("url-label")
         row_box.pack_start(url_label, True, True, 0)
 
         check_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
         check = Gtk.CheckButton(label="Batch" if is_gallery else "Gun Act")
         if is_gallery:
-            check.set_active(url in self.batch_urls)
-            check.connect("toggled", self.on_gallery_batch_toggled, url)
-            self.gallery_checks[url] = check
+            eventbox.check_handler = check.connect("toggled", lambda c, e=eventbox: self.on_gallery_batch_toggled(c, e.url))
         else:
-            check.set_active(url in self.gun_active_urls)
-            check.connect("toggled", self.on_carousel_gun_toggled, url)
-            self.carousel_gun_checks[url] = check
+            eventbox.check_handler = check.connect("toggled", lambda c, e=eventbox: self.on_carousel_gun_toggled(c, e.url))
         check_box.pack_start(check, False, False, 0)
 
-        header_lines, _, _, _ = parse_gxi(os.path.join(self.workbench_dir if not is_gallery else self.target_dir, urllib.parse.quote(url, safe='') + '.gxi'))
-        born_on = "Never"
-        account = ""
-        for line in header_lines:
-            stripped = line.strip()
-            if stripped.startswith('BORN_ON='):
-                born_on = stripped[8:].strip()
-            elif stripped.startswith('ACCOUNT='):
-                account = stripped[8:].strip()
-
-        born_label = Gtk.Label(label=f"Born On: {born_on}")
+        born_label = Gtk.Label()
         born_label.set_xalign(0)
         check_box.pack_start(born_label, False, False, 0)
 
-        acct_label = Gtk.Label(label=f"Acct: {account}")
+        acct_label = Gtk.Label()
         acct_label.set_xalign(0)
         acct_label.set_max_width_chars(18)
         acct_label.set_ellipsize(Pango.EllipsizeMode.END)
@@ -2055,21 +2913,85 @@ class BlitzControl(Gtk.Box):
         row_box.pack_start(check_box, False, False, 0)
 
         if is_gallery:
-            archive_btn = Gtk.Button(label="Restore" if self.is_archive else "Archive")
-            archive_btn.connect("clicked", self.archive_gxi, url)
+            archive_btn = Gtk.Button()
+            archive_btn.connect("clicked", lambda w, e=eventbox: self.archive_gxi(w, e.url))
             row_box.pack_start(archive_btn, False, False, 0)
+            eventbox.archive_btn = archive_btn
 
         eventbox.add(row_box)
-        if not is_gallery:
+        eventbox.thumb_btn = thumb_btn
+        eventbox.thumb_img = thumb_img
+        eventbox.url_label = url_label
+        eventbox.check = check
+        eventbox.born_label = born_label
+        eventbox.acct_label = acct_label
+        self.bind_thumb_row(eventbox, url)
+        return eventbox
+
+    def bind_thumb_row(self, eventbox, url):
+        is_gallery = eventbox.is_gallery
+        eventbox.url = url
+        row_dir = self.target_dir if is_gallery else self.workbench_dir
+        safe = _quote_url(url)
+
+        thumb_size = 100 if not is_gallery else 180
+        thumb_ctx = eventbox.thumb_btn.get_style_context()
+        thumb_ctx.remove_class("missing-thumb")
+        eventbox.thumb_img.clear()
+        thumb_path = os.path.join(row_dir, safe + '.png')
+        # Pooled rows get rebound while a decode is in flight; only the latest binding may set the image
+        eventbox.thumb_path = thumb_path
+        if safe + '.png' in dir_entries(row_dir):
+            def on_ready(pixbuf):
+                if eventbox.thumb_path == thumb_path:
+                    eventbox.thumb_img.set_from_pixbuf(pixbuf)
+
+            def on_error(e):
+                log_debug(CAT_FILE, f"Thumbnail load failed: {e}")
+                if eventbox.thumb_path == thumb_path:
+                    thumb_ctx.add_class("missing-thumb")
+
+            self.load_thumb(thumb_path, thumb_size, on_ready, on_error)
+        else:
+            thumb_ctx.add_class("missing-thumb")
+
+        eventbox.url_label.set_text(self.get_display_url(url))
+        eventbox.url_label.set_tooltip_text(url)
+
+        check = eventbox.check
+        check.handler_block(eventbox.check_handler)
+        if is_gallery:
+            check.set_active(url in self.batch_urls)
+            self.gallery_checks[url] = check
+        else:
+            check.set_active(url in self.gun_active_urls)
+            self.carousel_gun_checks[url] = check
+        check.handler_unblock(eventbox.check_handler)
+
+        header_lines = read_gxi_header(os.path.join(row_dir, safe + '.gxi'))
+        born_on = "Never"
+        account = ""
+        for line in header_lines:
+            stripped = line.strip()
+            if stripped.startswith('BORN_ON='):
+                born_on = stripped[8:].strip()
+            elif stripped.startswith('ACCOUNT='):
+                account = stripped[8:].strip()
+        eventbox.born_label.set_text(f"Born On: {born_on}")
+        eventbox.acct_label.set_text(f"Acct: {account}")
+
+        if is_gallery:
+            eventbox.archive_btn.set_label("Restore" if self.is_archive else "Archive")
+        else:
+            eventbox.get_style_context().remove_class("active-row")
             if check.get_active():
                 eventbox.get_style_context().add_class("active-row")
             self.row_widgets[url] = eventbox
-        return eventbox
 
     def on_gallery_batch_toggled(self, check, url):
         if self.mass_updating:
             return
-        safe = urllib.parse.quote(url, safe='')
+        safe = _quote_url(url)
         wb_path = os.path.join(self.workbench_dir, safe + '.gxi')
         target_path = os.path.join(self.target_dir, safe + '.gxi')
         wb_png = os.path.join(self.workbench_dir, safe + '.png')
@@ -2109,87 +3031,128 @@ class BlitzControl(Gtk.Box):
                 eventbox.get_style_context().remove_class("active-row")
 
     def grid_windows(self, expected_num):
-        if self.busy: return False
+        env = merged_env()[0]
+        if self.busy:
+            self._auto_fire_pending = False
+            return False
         self.busy = True
-        patterns = {p.strip().strip('"').strip("'").lower() for p in (read_merged_key('TARGET_PATTERNS') or '').split(',') if p.strip()}
+        patterns = {p.strip().strip('"').strip("'").lower() for p in (env.get('TARGET_PATTERNS') or '').split(',') if p.strip()}
+        grid_start_delay = safe_float(env.get('GRID_START_DELAY') or 5)
+        state = {'attempt': 0, 'last_total': -1, 'stagnant': 0, 'last_matched': [],
+                 'timer': None, 'rescan': None, 'watch': None}
+
+        def on_map():
+            # Coalesce a burst of map events into one rescan shortly after the first one
+            if state['rescan'] is None:
+                state['rescan'] = GLib.timeout_add(250, self._grid_poll, expected_num, patterns, grid_start_delay, state, False)
+
+        state['watch'] = x_map_watch(on_map)
+        # Each attempt is a main-loop timeout instead of a sleep, so the panel keeps redrawing while browsers load
+        self._grid_poll(expected_num, patterns, grid_start_delay, state)
+        return False
+
+    def _grid_scan(self, patterns):
+        log_debug(CAT_XDO, "XDO: search --onlyvisible .")
+        result = subprocess.run(['xdotool', 'search', '--onlyvisible', '.'], capture_output=True, text=True)
+        all_ids = result.stdout.strip().splitlines() if result.returncode == 0 else []
+        log_debug(CAT_XDO, f"XDO: search found {len(all_ids)} visible windows, returncode {result.returncode}")
+        matched = []
+        for wid, name in window_names(all_ids).items():
+            log_debug(CAT_XDO, lambda: f"XDO: wid {wid} title \"{name}\"")
+            if name.lower() in patterns:
+                matched.append(wid)
+        return len(all_ids), sorted(matched, key=int)
+
+    def _grid_poll(self, expected_num, patterns, grid_start_delay, state, tick=True):
         max_tries = 30
-        last_total_windows = -1
         stagnant_limit = 3
-        stagnant_count = 0
-        last_matched = []
-        grid_start_delay = safe_float(read_merged_key('GRID_START_DELAY') or 5)
-        for attempt in range(1, max_tries + 1):
-            log_debug(CAT_XDO, "XDO: search --onlyvisible .")
-            result = subprocess.run(['xdotool', 'search', '--onlyvisible', '.'], capture_output=True, text=True)
-            all_ids = result.stdout.strip().splitlines() if result.returncode == 0 else []
-            log_debug(CAT_XDO, f"XDO: search found {len(all_ids)} visible windows, returncode {result.returncode}")
-            if len(all_ids) == last_total_windows:
-                stagnant_count += 1
-            else:
-                stagnant_count = 0
-            last_total_windows = len(all_ids)
-            matched = []
-            for wid in all_ids:
-                log_debug(CAT_XDO, f"XDO: getwindowname {wid}")
-                name_res = subprocess.run(['xdotool', 'getwindowname', wid], capture_output=True, text=True)
-                name = name_res.stdout.strip()
-                log_debug(CAT_XDO, f"XDO: wid {wid} title \"{name}\", returncode {name_res.returncode}")
-                if name.lower() in patterns:
-                    matched.append(wid)
-            if matched:
-                last_matched = matched[:]
-            matched = sorted(matched, key=int)
-            if len(matched) >= expected_num:
-                self.current_wids = matched
-                self._grid_ids(matched)
-                time.sleep(grid_start_delay)
-                self.gentle_target_op('activate', capture=True)
-                self.update_status("Ready")
-                self.update_fire_state()
-                GLib.idle_add(lambda: self.parent_app.present())
-                self.busy = False
-                return False
-            if stagnant_count >= stagnant_limit:
-                if last_matched:
-                    self.current_wids = sorted(last_matched, key=int)
-                    self._grid_ids(self.current_wids)
-                    time.sleep(grid_start_delay)
-                    self.gentle_target_op('activate', capture=True)
-                self.update_status("Ready")
-                self.update_fire_state()
-                GLib.idle_add(lambda: self.parent_app.present())
-                self.busy = False
-                return False
-            time.sleep(grid_start_delay)
-        if last_matched:
-            self.current_wids = sorted(last_matched, key=int)
-            self._grid_ids(self.current_wids)
-            time.sleep(grid_start_delay)
-            self.gentle_target_op('activate', capture=True)
+        if tick:
+            state['attempt'] += 1
+            state['timer'] = None
+        else:
+            state['rescan'] = None
+        # Ticks always scan: titles can change without a map event, so map events only pull the next scan forward
+        total, matched = self._grid_scan(patterns)
+        changed = total != state['last_total']
+        state['last_total'] = total
+        if matched:
+            state['last_matched'] = matched
+        if changed:
+            state['stagnant'] = 0
+        elif tick:
+            state['stagnant'] += 1
+        if len(matched) >= expected_num:
+            self._grid_finish(matched, grid_start_delay, state)
+        elif tick and (state['stagnant'] >= stagnant_limit or state['attempt'] >= max_tries):
+            self._grid_finish(state['last_matched'], grid_start_delay, state)
+        elif tick:
+            state['timer'] = GLib.timeout_add(int(grid_start_delay * 1000), self._grid_poll, expected_num, patterns, grid_start_delay, state)
+        return False
+
+    def _grid_finish(self, wids, grid_start_delay, state):
+        for key in ('timer', 'rescan'):
+            if state[key] is not None:
+                GLib.source_remove(state[key])
+                state[key] = None
+        x_map_unwatch(state['watch'])
+        state['watch'] = None
+        if not wids:
+            self._grid_ready()
+            return
+        self.current_wids = wids
+        self._grid_ids(wids)
+        GLib.timeout_add(int(grid_start_delay * 1000), self._grid_activate)
+
+    def _grid_activate(self):
+        self.gentle_target_op('activate', capture=True)
+        self._grid_ready()
+        return False
+
+    def _grid_ready(self):
         self.update_status("Ready")
         self.update_fire_state()
         GLib.idle_add(lambda: self.parent_app.present())
         self.busy = False
-        return False
-
-    def _grid_ids(self, ids):
-        log_debug(CAT_XDO, "XDO: getdisplaygeometry")
-        result = subprocess.run(['xdotool', 'getdisplaygeometry'], capture_output=True, text=True)
-        sw, sh = 1920, 1080
-        if result.returncode == 0:
+        if self._auto_fire_pending:
+            self._auto_fire_pending = False
+            GLib.idle_add(lambda: self.on_fire() or False)
+
+    def _invalidate_display_geoms(self):
+        self._display_geom = None
+        self._monitor_geom = None
+
+    def _get_monitor_geom(self):
+        # Primary monitor rectangle, kept until the screen resizes or a monitor comes or goes
+        if self._monitor_geom is None:
+            self._monitor_geom = Gdk.Display.get_default().get_primary_monitor().get_geometry()
+        return self._monitor_geom
+
+    def _get_display_geom(self):
+        # Resolution is stable per session; the screen's size-changed signal clears this
+        if self._display_geom is None:
+            log_debug(CAT_XDO, "XDO: getdisplaygeometry")
+            result = subprocess.run(['xdotool', 'getdisplaygeometry'], capture_output=True, text=True)
+            if result.returncode != 0:
+                log_debug(CAT_XDO, f"XDO: getdisplaygeometry failed, returncode {result.returncode}")
+                return 1920, 1080
             try:
                 sw, sh = map(int, result.stdout.strip().split())
                 log_debug(CAT_XDO, f"XDO: display geometry {sw}x{sh}")
-            except:
+                self._display_geom = (sw, sh)
+            except Exception:
                 log_debug(CAT_XDO, "XDO: failed to parse display geometry")
-        else:
-            log_debug(CAT_XDO, f"XDO: getdisplaygeometry failed, returncode {result.returncode}")
+                return 1920, 1080
+        return self._display_geom
+
+    def _grid_ids(self, ids):
+        env = merged_env()[0]
+        sw, sh = self._get_display_geom()
 
         wx, wy, ww, wh = 0, 0, sw, sh
         work_result = subprocess.run(['xprop', '-root', '-notype', '_NET_WORKAREA'], capture_output=True, text=True)
         if work_result.returncode == 0:
             output = work_result.stdout.strip()
-            numbers = re.findall(r'\d+', output)
+            numbers = _DIGITS_RE.findall(output)
             if len(numbers) >= 4:
                 wx = int(numbers[0])
                 wy = int(numbers[1])
@@ -2197,9 +3160,9 @@ class BlitzControl(Gtk.Box):
                 wh = int(numbers[3])
                 log_debug(CAT_XDO, f"XDO: workarea {wx},{wy} {ww}x{wh}")
 
-        target_width = safe_int(read_merged_key('TARGET_WIDTH') or 640)
-        target_height = safe_int(read_merged_key('TARGET_HEIGHT') or 500)
-        target_overlap = safe_int(read_merged_key('MAX_OVERLAP_PERCENT') or 40)
+        target_width = safe_int(env.get('TARGET_WIDTH') or 640)
+        target_height = safe_int(env.get('TARGET_HEIGHT') or 500)
+        target_overlap = safe_int(env.get('MAX_OVERLAP_PERCENT') or 40)
         margin = 20
         available_width = ww - 2 * margin
         available_height = wh - 2 * margin
@@ -2237,9 +3200,11 @@ class BlitzControl(Gtk.Box):
                 step_y = max(1, (available_height - target_height) // (rows - 1))
         x_start = wx + margin + max(0, (available_width - (target_width + (cols - 1) * step_x)) // 2)
         y_start = wy + margin + max(0, (available_height - (target_height + (rows - 1) * step_y)) // 2)
-        relative_x = percent_to_pixels(read_merged_key('PROMPT_X_FROM_LEFT') or '50%', target_width)
-        relative_y = target_height - percent_to_pixels(read_merged_key('PROMPT_Y_FROM_BOTTOM') or '10%', target_height)
+        relative_x = percent_to_pixels(env.get('PROMPT_X_FROM_LEFT') or '50%', target_width)
+        relative_y = target_height - percent_to_pixels(env.get('PROMPT_Y_FROM_BOTTOM') or '10%', target_height)
         self.capture_click_positions = []
+        trace_geom = bool(GLOBAL_DEBUG_MASK & CAT_XDO)
+        moves = []
         try:
             for idx, wid in enumerate(ids):
                 r = idx // cols
@@ -2250,6 +3215,10 @@ class BlitzControl(Gtk.Box):
                 click_y = y + relative_y
                 self.capture_click_positions.append((click_x, click_y))
 
+                if not trace_geom:
+                    moves.append((wid, target_width, target_height, x, y))
+                    continue
+
                 geom_res = subprocess.run(['xdotool', 'getwindowgeometry', '--shell', wid], capture_output=True, text=True)
                 if geom_res.returncode == 0:
                     log_debug(CAT_XDO, f"XDO: pre-grid geometry wid {wid}:\n{geom_res.stdout.strip()}")
@@ -2263,6 +3232,8 @@ class BlitzControl(Gtk.Box):
                     log_debug(CAT_XDO, f"XDO: post-grid geometry wid {wid}:\n{geom_res.stdout.strip()}")
                 else:
                     log_debug(CAT_XDO, f"XDO: post-grid getwindowgeometry failed for wid {wid}, returncode {geom_res.returncode}")
+            xdo_resize_move_many(moves, sync=False)
+            x_sync()
         except Exception as e:
             log_debug(CAT_XDO, f"XDO: exception during grid positioning: {e}")
 
@@ -2352,12 +3323,13 @@ class BlitzControl(Gtk.Box):
         log_debug(CAT_GUI, f"Deselect All Gallery COMPLETE")
         self.busy = False
 
-    def handle_startup_source(self, startup_source):
-        if not startup_source:
+    def handle_startup_source(self, kind, value, urls=None):
+        if not kind:
             return
-        if startup_source.startswith('--url-file='):
-            file_path = startup_source.split('=', 1)[1]
-            urls = get_urls_from_input(file_path)
+        if kind == 'url_file':
+            file_path = value
+            if urls is None:
+                urls = get_urls_from_input(file_path)
             added = 0
             for url in urls:
                 if self.add_or_select_url(url):
@@ -2369,18 +3341,18 @@ class BlitzControl(Gtk.Box):
 
             self.wb_gxi_paths = {}
             for u in self.all_urls:
-                safe_name = urllib.parse.quote(u, safe='') + '.gxi'
+                safe_name = _quote_url(u) + '.gxi'
                 self.wb_gxi_paths[u] = os.path.join(self.workbench_dir, safe_name)
 
             self.load_all_gxi()
             self.load_current_gxi()
-        elif startup_source.startswith('--url='):
-            url = startup_source.split('=', 1)[1]
+        elif kind == 'url':
+            url = value
             self.add_or_select_url(url)
             self.load_all_gxi()
             self.load_current_gxi()
-        elif startup_source.startswith('--gxi='):
-            gxi_path = startup_source.split('=', 1)[1]
+        elif kind == 'gxi':
+            gxi_path = value
             if not os.path.exists(gxi_path):
                 log_debug(CAT_INIT, f"External GXI not found: {gxi_path}")
                 return
@@ -2392,14 +3364,15 @@ class BlitzControl(Gtk.Box):
             else:
                 shutil.copy2(gxi_path, wb_path)
             try:
-                with open(wb_path, 'r', encoding='utf-8') as f:
-                    first_line = f.readline().strip()
-                    if first_line.startswith('TARGET_URL='):
-                        url = first_line.split('=', 1)[1].strip().strip('"\'')
-                        self.current_url = url
-                        update_env(USER_ENV, 'DEFAULT_CURRENT_URL', url)
-                        self.batch_urls.add(url)
-                        self.gun_active_urls.add(url)
+                # Parsed through the cache so the editor load that follows reuses this read
+                header_lines = parse_gxi_cached(wb_path)[0]
+                first_line = header_lines[0].strip() if header_lines else ''
+                if first_line.startswith('TARGET_URL='):
+                    url = first_line.split('=', 1)[1].strip().strip('"\'')
+                    self.current_url = url
+                    update_env(USER_ENV, 'DEFAULT_CURRENT_URL', url)
+                    self.batch_urls.add(url)
+                    self.gun_active_urls.add(url)
             except Exception as e:
                 log_debug(CAT_INIT, f"Failed to extract URL from {wb_path}: {e}")
             self.load_all_gxi()
@@ -2410,7 +3383,7 @@ class BlitzControl(Gtk.Box):
         if not url or '://' not in url:
             log_debug(CAT_INIT, f"Rejected non-URL '{url}' - not adding to gallery or workbench")
             return False
-        safe = urllib.parse.quote(url, safe='') + '.gxi'
+        safe = _quote_url(url) + '.gxi'
         target_path = os.path.join(self.target_dir, safe)
         wb_path = os.path.join(self.workbench_dir, safe)
         created = False
@@ -2418,15 +3391,17 @@ class BlitzControl(Gtk.Box):
             if os.path.exists(target_path):
                 shutil.copy2(target_path, wb_path)
             else:
-                with open(wb_path, 'w', encoding='utf-8') as f:
-                    f.write(f"TARGET_URL={url}\n")
-                    f.write(f"BORN_ON={datetime.now().strftime('%Y-%m-%d')}\n")
-                    f.write("ACCOUNT=\n")
-                    f.write("TARGET_DESC=\n\n")
-                    for stage in ['U', '1', '2', '3']:
-                        f.write(f"STAGE_{stage}\n\n")
-                        f.write(f".history_{stage}\n\n")
-                created = True
+                head = f"TARGET_URL={url}\nBORN_ON={datetime.now().strftime('%Y-%m-%d')}\n".encode('utf-8')
+                try:
+                    fd = os.open(wb_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                except FileExistsError:
+                    fd = None
+                if fd is not None:
+                    try:
+                        os.write(fd, head + _GXI_TEMPLATE_TAIL)
+                    finally:
+                        os.close(fd)
+                    created = True
             log_debug(CAT_INIT, f"Created/copied to workbench for {url}")
 
             if not os.path.exists(target_path):
@@ -2454,6 +3429,44 @@ class BlitzControl(Gtk.Box):
         self.carousel_box.queue_resize()
         return False
 
+# Checked in this order, matching the old argparse precedence; values are the startup kinds BlitzControl handles
+STARTUP_FLAGS = {'--gxi': 'gxi', '--url': 'url', '--url-file': 'url_file'}
+
+def _argparse_startup(argv):
+    import argparse
+    parser = argparse.ArgumentParser(description="Blitz Talker Control")
+    parser.add_argument("--url", type=str, help="Load a single URL")
+    parser.add_argument("--gxi", type=str, help="Load a .gxi file (extracts URL and loads)")
+    parser.add_argument("--url-file", type=str, help="Load URLs from a file")
+    args = parser.parse_args(argv)
+    selected = [flag for flag, value in (('--url', args.url), ('--gxi', args.gxi), ('--url-file', args.url_file)) if value]
+    if len(selected) > 1:
+        parser.error(f"argument {selected[1]}: not allowed with argument {selected[0]}")
+    for kind, value in (('gxi', args.gxi), ('url', args.url), ('url_file', args.url_file)):
+        if value:
+            return kind, value
+    return None, None
+
+def parse_startup_args(argv):
+    # Plain launches only scan argv; argparse is imported for --help and anything it would reject
+    found = {}
+    i = 0
+    while i < len(argv):
+        flag, eq, value = argv[i].partition('=')
+        if flag not in STARTUP_FLAGS or (not eq and i + 1 >= len(argv)):
+            return _argparse_startup(argv)
+        if not eq:
+            i += 1
+            value = argv[i]
+        found[flag] = value
+        i += 1
+    if len(found) > 1:
+        return _argparse_startup(argv)
+    for flag, kind in STARTUP_FLAGS.items():
+        if found.get(flag):
+            return kind, found[flag]
+    return None, None
+
 class UnifiedApp(Gtk.Window):
     def __init__(self):
         super().__init__(title="Blitz Talker — Ready")
@@ -2461,58 +3474,69 @@ class UnifiedApp(Gtk.Window):
         self.box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         self.add(self.box)
 
-        width_str = read_merged_key('PANEL_DEFAULT_WIDTH')
-        height_str = read_merged_key('PANEL_DEFAULT_HEIGHT')
-        self.saved_width = safe_int(width_str, -1)
-        self.saved_height = safe_int(height_str, -1)
-        self.saved_x_off = safe_int(read_merged_key('PANEL_DEFAULT_X_OFFSET'))
-        self.saved_y_off = safe_int(read_merged_key('PANEL_DEFAULT_Y_OFFSET'))
+        # Read once here; on_realize reuses these and save_all_geoms keeps them current
+        self.saved_width = read_merged_int('PANEL_DEFAULT_WIDTH', -1)
+        self.saved_height = read_merged_int('PANEL_DEFAULT_HEIGHT', -1)
+        self.saved_x_off = read_merged_int('PANEL_DEFAULT_X_OFFSET')
+        self.saved_y_off = read_merged_int('PANEL_DEFAULT_Y_OFFSET')
         if self.saved_width > 0 and self.saved_height > 0:
             self.set_default_size(self.saved_width, self.saved_height)
 
-        parser = argparse.ArgumentParser(description="Blitz Talker Control")
-        group = parser.add_mutually_exclusive_group()
-        group.add_argument("--url", type=str, help="Load a single URL")
-        group.add_argument("--gxi", type=str, help="Load a .gxi file (extracts URL and loads)")
-        group.add_argument("--url-file", type=str, help="Load URLs from a file")
-        args = parser.parse_args()
-
-        startup_source = None
-        if args.gxi:
-            startup_source = f"--gxi={args.gxi}"
-        elif args.url:
-            startup_source = f"--url={args.url}"
-        elif args.url_file:
-            startup_source = f"--url-file={args.url_file}"
-
-        self.gun = BlitzControl(self, startup_source=startup_source)
+        startup_kind, startup_value = parse_startup_args(sys.argv[1:])
+
+        # The URL file is read here once; BlitzControl gets the list rather than the path to read again
+        self.url_list = get_urls_from_input(startup_value) if startup_kind == 'url_file' else None
+        self.gun = BlitzControl(self, startup_kind=startup_kind, startup_value=startup_value,
+                                startup_urls=self.url_list)
         self.box.pack_start(self.gun, True, True, 0)
 
+        self._last_cfg = None
+        self._save_enabled = False
         self.connect("realize", self.on_realize)
         self.connect("configure-event", self.on_configure)
 
     def on_realize(self, widget):
-        self.gun.restore_all_geoms()
+        # Editor geometry reload waits for the first frame; the panel move below stays synchronous
+        GLib.idle_add(self._idle_restore_geoms)
         try:
-            monitor = Gdk.Display.get_default().get_primary_monitor()
-            geom = monitor.get_geometry()
-            saved_x = safe_int(read_merged_key('PANEL_DEFAULT_X_OFFSET'))
-            saved_y_off = safe_int(read_merged_key('PANEL_DEFAULT_Y_OFFSET'))
+            geom = self.gun._get_monitor_geom()
+            saved_x = self.saved_x_off
+            saved_y_off = self.saved_y_off
             h = self.get_size().height
             calculated_y = geom.height - h - saved_y_off
-            log_debug(CAT_GEOM, f"MAIN PANEL REALIZE REQUESTED: x={saved_x}, y_off={saved_y_off}, calculated_y={calculated_y}")
+            log_debug(CAT_GEOM, lambda: f"MAIN PANEL REALIZE REQUESTED: x={saved_x}, y_off={saved_y_off}, calculated_y={calculated_y}")
             self.move(saved_x, calculated_y)
-            actual_w, actual_h = self.get_size()
-            actual_x, actual_y = self.get_position()
-            log_debug(CAT_GEOM, f"MAIN PANEL ACTUAL AFTER REALIZE: size={actual_w}x{actual_h}, pos=({actual_x},{actual_y})")
+            if log_enabled(CAT_GEOM):
+                actual_w, actual_h = self.get_size()
+                actual_x, actual_y = self.get_position()
+                log_debug(CAT_GEOM, lambda: f"MAIN PANEL ACTUAL AFTER REALIZE: size={actual_w}x{actual_h}, pos=({actual_x},{actual_y})")
         except Exception as e:
             log_debug(CAT_GUI, f"Main window realize geometry error: {e}")
 
+    def _idle_restore_geoms(self):
+        try:
+            self.gun.restore_all_geoms()
+        except Exception as e:
+            log_debug(CAT_GUI, f"Deferred geometry restore error: {e}")
+        return False
+
     def on_configure(self, widget, event):
-        self.gun.save_all_geoms()
+        # Restacking and repeated configures with the same rectangle have nothing new to save
+        cfg = (event.x, event.y, event.width, event.height)
+        if cfg == self._last_cfg:
+            return False
+        self._last_cfg = cfg
+        if not self._save_enabled:
+            return False
+        return self.gun.schedule_geom_save('PANEL_DEFAULT')
+
+    def on_startup_settled(self):
+        # Configures from the initial realize/map cascade restate saved geometry; only later ones are user moves
+        self._save_enabled = True
         return False
 
 if __name__ == '__main__':
     app = UnifiedApp()
     app.show_all()
+    GLib.idle_add(app.on_startup_settled)
     Gtk.main()